@@ -0,0 +1,41 @@
+"""Shared Qt widget helpers for napari-metadata widgets.
+
+``_bold_label`` and ``_apply_tooltip`` are used by both the
+layer-metadata components (``widgets``) and the viewer-metadata
+components (``viewer_widgets``).
+"""
+
+from __future__ import annotations
+
+from qtpy.QtWidgets import QLabel, QWidget
+
+_BOLD_STYLE = 'font-weight: bold;'
+
+
+def _bold_label(
+    text: str,
+    parent: QWidget | None = None,
+    *,
+    color: str | None = None,
+) -> QLabel:
+    """Return a bold ``QLabel`` styled from one shared stylesheet string.
+
+    Boldness stays in QSS rather than ``setFont`` because napari's
+    application stylesheet sets widget fonts, which would override an
+    explicit font.
+    """
+    label = QLabel(text, parent=parent)
+    label.setStyleSheet(
+        _BOLD_STYLE if color is None else f'color: {color}; {_BOLD_STYLE}'
+    )
+    return label
+
+
+def _apply_tooltip(widget: QWidget, text: str) -> None:
+    """Set *widget*'s tooltip unless it already shows *text*.
+
+    ``setToolTip`` sends a ``ToolTipChange`` event even when the text is
+    unchanged, and tooltips are re-applied on every load and page build.
+    """
+    if widget.toolTip() != text:
+        widget.setToolTip(text)
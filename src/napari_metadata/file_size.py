@@ -8,11 +8,19 @@ import math
 import urllib
 from pathlib import Path
 from typing import Union
+from weakref import WeakKeyDictionary
 
 from napari.layers import Layer
 
 logger = logging.getLogger()
 
+# On-disk size text per layer, tagged with the source path it was measured
+# from.  Walking a directory source is expensive and a loaded layer's source
+# does not change, so switching between layers reuses the first result.
+_DISK_SIZE_TEXT: WeakKeyDictionary[Layer, tuple[str, str]] = (
+    WeakKeyDictionary()
+)
+
 
 def _generate_text_for_size(size: Union[int, float], suffix: str = '') -> str:
     """Generate the text for the file size widget. Consumes size in bytes,
@@ -66,31 +74,33 @@ def generate_display_size(layer: Layer) -> str:
     str
         Formatted string for the file size or size in memory of the data.
     """
-    is_url = urllib.parse.urlparse(layer.source.path).scheme in (
+    source_path = layer.source.path
+    is_url = urllib.parse.urlparse(source_path).scheme in (
         'http',
         'https',
     )
     # data exists in file on disk
-    if layer.source.path and not is_url:
-        p = Path(layer.source.path)
+    if source_path and not is_url:
+        cached = _DISK_SIZE_TEXT.get(layer)
+        if cached is not None and cached[0] == source_path:
+            return cached[1]
+        p = Path(source_path)
         if p.is_dir():
             size = sum(
                 file.stat().st_size for file in p.rglob('*') if file.is_file()
             )
         else:
             size = p.stat().st_size
-        suffix = ''
+        text = _generate_text_for_size(size)
+        _DISK_SIZE_TEXT[layer] = (source_path, text)
+        return text
     # data exists only in memory
+    if (
+        type(layer).__name__ == 'Shapes'
+        or type(layer).__name__ == 'Surface'
+        or layer.multiscale is True
+    ):
+        size = sum(d.nbytes for d in layer.data)
     else:
-        if (
-            type(layer).__name__ == 'Shapes'
-            or type(layer).__name__ == 'Surface'
-            or layer.multiscale is True
-        ):
-            size = sum(d.nbytes for d in layer.data)
-        else:
-            size = layer.data.nbytes
-        suffix = ' (in memory)'
-    text = _generate_text_for_size(size, suffix=suffix)
-
-    return text
+        size = layer.data.nbytes
+    return _generate_text_for_size(size, suffix=' (in memory)')
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING
 from qtpy.QtCore import Qt
 from qtpy.QtWidgets import QLabel, QWidget
 
+from napari_metadata._qt_utils import _apply_tooltip, _bold_label
+
 if TYPE_CHECKING:
     from napari.components import ViewerModel
 
@@ -26,8 +28,7 @@ class ViewerComponentBase(ABC):
         super().__init__()
         self._napari_viewer = napari_viewer
         self._parent_widget = parent_widget
-        self._component_qlabel = QLabel(self._label_text, parent=parent_widget)
-        self._component_qlabel.setStyleSheet('font-weight: bold')
+        self._component_qlabel = _bold_label(self._label_text, parent_widget)
         self._component_qlabel.setToolTip(self._tooltip_text)
         self._display_label = QLabel('', parent=parent_widget)
         self._display_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
@@ -48,8 +49,9 @@ class ViewerComponentBase(ABC):
         """Refresh the display from the current viewer state."""
         if viewer is not None:
             self._napari_viewer = viewer
+        tooltip = self._tooltip_text
         for widget in self.value_widgets:
-            widget.setToolTip(self._tooltip_text)
+            _apply_tooltip(widget, tooltip)
         self._update_display()
 
     def clear(self) -> None:
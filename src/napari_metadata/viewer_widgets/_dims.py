@@ -21,6 +21,16 @@ from qtpy.QtWidgets import (
 if TYPE_CHECKING:
     from napari.components import ViewerModel
 
+# Bound once: the table model's data/headerData run per cell on every
+# repaint, and each ``Qt.ItemDataRole.X`` is two enum attribute lookups.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = Qt.ItemDataRole.EditRole
+_TEXT_ROLES = (_DISPLAY_ROLE, _EDIT_ROLE)
+_TEXT_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+_CELL_ALIGNMENT = int(
+    Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+)
+
 
 @dataclass(frozen=True)
 class AxisLabelRow:
@@ -106,18 +116,13 @@ class AxisLabelTableModel(QAbstractTableModel):
         return len(self._header_labels)
 
     def data(
-        self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+        self, index: QModelIndex, role: int = _DISPLAY_ROLE
     ) -> str | int | None:
         if not index.isValid():
             return None
-        if role == Qt.ItemDataRole.TextAlignmentRole:
-            return int(
-                Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
-            )
-        if role not in (
-            Qt.ItemDataRole.DisplayRole,
-            Qt.ItemDataRole.EditRole,
-        ):
+        if role == _TEXT_ALIGNMENT_ROLE:
+            return _CELL_ALIGNMENT
+        if role not in _TEXT_ROLES:
             return None
 
         row = self._rows[index.row()]
@@ -149,12 +154,12 @@ class AxisLabelTableModel(QAbstractTableModel):
         self,
         index: QModelIndex,
         value,
-        role: int = Qt.ItemDataRole.EditRole,
+        role: int = _EDIT_ROLE,
     ) -> bool:
         """Persist edits to viewer or layer labels for editable columns."""
         if not index.isValid():
             return False
-        if role != Qt.ItemDataRole.EditRole:
+        if role != _EDIT_ROLE:
             return False
 
         new_value = str(value)
@@ -185,7 +190,7 @@ class AxisLabelTableModel(QAbstractTableModel):
             self.dataChanged.emit(
                 self.index(index.row(), self.VIEWER_COLUMN),
                 self.index(index.row(), self.SETTING_COLUMN),
-                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+                list(_TEXT_ROLES),
             )
             return True
 
@@ -217,7 +222,7 @@ class AxisLabelTableModel(QAbstractTableModel):
             self.dataChanged.emit(
                 self.index(index.row(), self.SETTING_COLUMN),
                 self.index(index.row(), self.LAYER_COLUMN),
-                [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole],
+                list(_TEXT_ROLES),
             )
             return True
 
@@ -227,9 +232,9 @@ class AxisLabelTableModel(QAbstractTableModel):
         self,
         section: int,
         orientation: Qt.Orientation,
-        role: int = Qt.ItemDataRole.DisplayRole,
+        role: int = _DISPLAY_ROLE,
     ) -> str | None:
-        if role != Qt.ItemDataRole.DisplayRole:
+        if role != _DISPLAY_ROLE:
             return None
 
         if orientation == Qt.Orientation.Horizontal:
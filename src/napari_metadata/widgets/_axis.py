@@ -15,7 +15,9 @@ provides aggregate operations (label propagation, checkbox toggling).
 from __future__ import annotations
 
 from contextlib import suppress
+from functools import cache
 from typing import TYPE_CHECKING
+from weakref import WeakKeyDictionary
 
 import numpy as np
 import pint
@@ -30,19 +32,79 @@ from qtpy.QtWidgets import (
 )
 from superqt import QEnumComboBox
 
+from napari_metadata._qt_utils import _apply_tooltip
 from napari_metadata.units import AxisUnitEnum, _UnitConfig
 from napari_metadata.widgets._base import (
     AxisComponentBase,
     BoundLayerCoordinator,
     LayoutEntry,
+    _set_combobox_items,
     _WidgetCollection,
 )
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterator, Sequence
 
     from napari.layers import Layer
 
+#: ``(axis_type, config)`` for every enum member with a curated unit list,
+#: in declaration order.  The enum is immutable, so this is resolved once
+#: instead of walking the enum machinery per axis on every repopulation.
+_CONFIGURED_AXIS_TYPES: tuple[tuple[AxisUnitEnum, _UnitConfig], ...] = tuple(
+    (axis_type, axis_type.config)
+    for axis_type in AxisUnitEnum
+    if axis_type.config is not None
+)
+
+#: Lower-cased unit texts that reset an axis to napari's pixel default.
+_RESET_UNIT_TEXTS = frozenset({'', 'none'})
+
+#: Display strings of pint units, keyed weakly by the unit object.  pint's
+#: ``Unit.__str__`` runs the full formatter pipeline, and the same few
+#: units are stringified per axis on every refresh.
+_UNIT_STR_CACHE: WeakKeyDictionary[pint.Unit, str] = WeakKeyDictionary()
+
+
+def _unit_str(unit: pint.Unit) -> str:
+    """Return ``str(unit)``, memoized in ``_UNIT_STR_CACHE``."""
+    try:
+        return _UNIT_STR_CACHE[unit]
+    except KeyError:
+        text = _UNIT_STR_CACHE[unit] = str(unit)
+        return text
+
+
+@cache
+def _labeled_units(cfg: _UnitConfig) -> tuple[tuple[str, pint.Unit], ...]:
+    """Return ``(display text, pint.Unit)`` pairs for a unit configuration.
+
+    Configurations are frozen and few, so the parsed units and their
+    formatted labels are computed once per configuration.
+    """
+    return tuple((_unit_str(u), u) for u in cfg.pint_units())
+
+
+@cache
+def _unit_indices(cfg: _UnitConfig) -> dict[str, int]:
+    """Return the combobox row of each label from ``_labeled_units(cfg)``."""
+    return {text: i for i, (text, _) in enumerate(_labeled_units(cfg))}
+
+
+@cache
+def _axis_type_by_label() -> dict[str, tuple[AxisUnitEnum, _UnitConfig]]:
+    """Return unit label -> ``(axis_type, config)`` owning it.
+
+    Keyed on the same formatted labels as ``_unit_indices``, so a matched
+    label always has a row in its configuration's combobox.  When a unit
+    is curated by several types the first in declaration order wins, as
+    in a linear scan of ``_CONFIGURED_AXIS_TYPES``.
+    """
+    return {
+        text: (axis_type, cfg)
+        for axis_type, cfg in reversed(_CONFIGURED_AXIS_TYPES)
+        for text in _unit_indices(cfg)
+    }
+
 
 class AxisLabels(AxisComponentBase):
     """Per-axis label editor using ``QLineEdit`` widgets.
@@ -73,6 +135,7 @@ class AxisLabels(AxisComponentBase):
     def _create_widgets(self, layer: Layer) -> None:
         labels = layer.axis_labels
         ndim = layer.ndim
+        on_editing_finished = self._on_editing_finished
         for i in range(ndim):
             # Empty label for layout alignment
             empty_label = QLabel(parent=self._parent_widget)
@@ -80,26 +143,24 @@ class AxisLabels(AxisComponentBase):
 
             line_edit = QLineEdit(parent=self._parent_widget)
             line_edit.setText(labels[i] if i < len(labels) else '')
-            line_edit.editingFinished.connect(self._on_editing_finished)
+            line_edit.editingFinished.connect(on_editing_finished)
             self._line_edits.append(line_edit)
 
         self._create_inherit_checkboxes(layer)
 
     def _refresh_values(self, layer: Layer) -> None:
-        labels = layer.axis_labels
-        for i, label in enumerate(labels):
-            if i < len(self._line_edits):
-                with QSignalBlocker(self._line_edits[i]):
-                    self._line_edits[i].setText(label)
+        for line_edit, label in zip(
+            self._line_edits, layer.axis_labels, strict=False
+        ):
+            with QSignalBlocker(line_edit):
+                line_edit.setText(label)
 
-    def get_layout_entries(self, axis_index: int) -> list[LayoutEntry]:
+    def _build_layout_row(self, axis_index: int) -> Iterator[LayoutEntry]:
         """Skip the empty axis-name column; span the line edit across all value cols."""
         line_edit = self._line_edits[axis_index]
-        line_edit.setToolTip(self._tooltip_text)
-        return [
-            LayoutEntry(widgets=[line_edit], col_span=3),
-            LayoutEntry(widgets=[self._inherit_checkboxes[axis_index]]),
-        ]
+        _apply_tooltip(line_edit, self._tooltip_text)
+        yield LayoutEntry(widgets=[line_edit], col_span=3)
+        yield LayoutEntry(widgets=[self._inherit_checkboxes[axis_index]])
 
     def _get_value_entries(self, axis_index: int) -> list[LayoutEntry]:
         return [LayoutEntry(widgets=[self._line_edits[axis_index]])]
@@ -127,7 +188,11 @@ class AxisLabels(AxisComponentBase):
 
 
 class AxisTranslations(AxisComponentBase):
-    """Per-axis translation editor using ``QDoubleSpinBox`` widgets."""
+    """Per-axis translation editor using ``QDoubleSpinBox`` widgets.
+
+    Keyboard tracking is disabled, so typed values are written to the
+    layer once on commit (Enter / focus-out) rather than per keystroke.
+    """
 
     _label_text = 'Translate:'
 
@@ -141,23 +206,23 @@ class AxisTranslations(AxisComponentBase):
     def _create_widgets(self, layer: Layer) -> None:
         self._create_axis_name_labels(layer)
         translations = layer.translate
+        on_value_changed = self._on_value_changed
         for value in translations:
             sb = QDoubleSpinBox(parent=self._parent_widget)
             sb.setDecimals(1)
             sb.setSingleStep(1.0)
             sb.setRange(-1_000_000, 1_000_000)
+            sb.setKeyboardTracking(False)
             sb.setValue(value)
-            sb.valueChanged.connect(self._on_value_changed)
+            sb.valueChanged.connect(on_value_changed)
             self._spinboxes.append(sb)
 
         self._create_inherit_checkboxes(layer)
 
     def _refresh_values(self, layer: Layer) -> None:
-        translations = layer.translate
-        for i, value in enumerate(translations):
-            if i < len(self._spinboxes):
-                with QSignalBlocker(self._spinboxes[i]):
-                    self._spinboxes[i].setValue(value)
+        for sb, value in zip(self._spinboxes, layer.translate, strict=False):
+            with QSignalBlocker(sb):
+                sb.setValue(value)
 
     def _get_value_entries(self, axis_index: int) -> list[LayoutEntry]:
         return [LayoutEntry(widgets=[self._spinboxes[axis_index]], col_span=2)]
@@ -168,6 +233,11 @@ class AxisTranslations(AxisComponentBase):
     def _apply_values(self, layer: Layer, values: list) -> None:
         layer.translate = tuple(values)
 
+    def _merge_values(
+        self, mask: np.ndarray, current_values: tuple, template_values: tuple
+    ) -> list:
+        return np.where(mask, template_values, current_values).tolist()
+
     def _on_value_changed(self) -> None:
         values = tuple(sb.value() for sb in self._spinboxes)
         self._require_selected_layer().translate = values
@@ -197,24 +267,24 @@ class AxisScales(AxisComponentBase):
     def _create_widgets(self, layer: Layer) -> None:
         self._create_axis_name_labels(layer)
         scales = layer.scale
+        on_value_changed = self._on_value_changed
+        on_editing_finished = self._on_editing_finished
         for value in scales:
             sb = QDoubleSpinBox(parent=self._parent_widget)
             sb.setDecimals(3)
             sb.setSingleStep(0.1)
             sb.setRange(self._SCALE_MINIMUM, 1_000_000)
             sb.setValue(value)
-            sb.valueChanged.connect(self._on_value_changed)
-            sb.editingFinished.connect(self._on_editing_finished)
+            sb.valueChanged.connect(on_value_changed)
+            sb.editingFinished.connect(on_editing_finished)
             self._spinboxes.append(sb)
 
         self._create_inherit_checkboxes(layer)
 
     def _refresh_values(self, layer: Layer) -> None:
-        scales = layer.scale
-        for i, value in enumerate(scales):
-            if i < len(self._spinboxes):
-                with QSignalBlocker(self._spinboxes[i]):
-                    self._spinboxes[i].setValue(value)
+        for sb, value in zip(self._spinboxes, layer.scale, strict=False):
+            with QSignalBlocker(sb):
+                sb.setValue(value)
 
     def _get_value_entries(self, axis_index: int) -> list[LayoutEntry]:
         return [LayoutEntry(widgets=[self._spinboxes[axis_index]], col_span=2)]
@@ -223,21 +293,24 @@ class AxisScales(AxisComponentBase):
         return tuple(layer.scale)
 
     def _apply_values(self, layer: Layer, values: list) -> None:
-        layer.scale = np.array(
-            tuple(max(v, self._SCALE_MINIMUM) for v in values)
-        )
+        layer.scale = np.maximum(values, self._SCALE_MINIMUM)
+
+    def _merge_values(
+        self, mask: np.ndarray, current_values: tuple, template_values: tuple
+    ) -> list:
+        return np.where(mask, template_values, current_values).tolist()
 
     def _on_value_changed(self) -> None:
-        values = np.array(tuple(sb.value() for sb in self._spinboxes))
+        values = np.fromiter(
+            (sb.value() for sb in self._spinboxes),
+            dtype=float,
+            count=len(self._spinboxes),
+        )
         self._require_selected_layer().scale = values
 
     def _on_editing_finished(self) -> None:
         """Sync displayed values to the layer values after edit commit."""
-        scales = self._require_selected_layer().scale
-        for i, value in enumerate(scales):
-            if i < len(self._spinboxes):
-                with QSignalBlocker(self._spinboxes[i]):
-                    self._spinboxes[i].setValue(value)
+        self._refresh_values(self._require_selected_layer())
 
 
 class AxisUnits(AxisComponentBase):
@@ -273,7 +346,9 @@ class AxisUnits(AxisComponentBase):
         ndim = layer.ndim
 
         for i in range(ndim):
-            unit_str = str(layer_units[i]) if i < len(layer_units) else ''
+            unit_str = (
+                _unit_str(layer_units[i]) if i < len(layer_units) else ''
+            )
 
             # Type combobox (space / time / custom)
             type_cb = QEnumComboBox(
@@ -290,7 +365,9 @@ class AxisUnits(AxisComponentBase):
             )
 
             # Free-form line edit for CUSTOM type
-            line_edit = QLineEdit(parent=self._parent_widget)
+            line_edit = QLineEdit(unit_str, parent=self._parent_widget)
+            unit_cb.setVisible(matched_type is not None)
+            line_edit.setVisible(matched_type is None)
 
             self._type_comboboxes.append(type_cb)
             self._unit_comboboxes.append(unit_cb)
@@ -299,20 +376,19 @@ class AxisUnits(AxisComponentBase):
         self._create_inherit_checkboxes(layer)
 
         # Connect signals *after* all widgets exist to avoid partial updates.
+        on_type_changed = self._on_type_changed
+        on_unit_changed = self._on_unit_changed
         for type_cb in self._type_comboboxes:
-            type_cb.currentIndexChanged.connect(self._on_type_changed)
+            type_cb.currentIndexChanged.connect(on_type_changed)
         for unit_cb in self._unit_comboboxes:
-            unit_cb.currentIndexChanged.connect(self._on_unit_changed)
+            unit_cb.currentIndexChanged.connect(on_unit_changed)
         for le in self._unit_line_edits:
-            le.editingFinished.connect(self._on_unit_changed)
-
-        self._sync_visibilities()
-        self._sync_line_edit_texts()
+            le.editingFinished.connect(on_unit_changed)
 
     def _refresh_values(self, layer: Layer) -> None:
         layer_units = layer.units
         for i, unit in enumerate(layer_units[: len(self._unit_comboboxes)]):
-            unit_str = str(unit)
+            unit_str = _unit_str(unit)
             matched_type = self._populate_unit_combobox(
                 unit_str, self._unit_comboboxes[i]
             )
@@ -322,7 +398,6 @@ class AxisUnits(AxisComponentBase):
                 self._type_comboboxes[i].setCurrentEnum(
                     matched_type or AxisUnitEnum.CUSTOM
                 )
-        self._sync_line_edit_texts()
         self._sync_visibilities()
 
     def _get_value_entries(self, axis_index: int) -> list[LayoutEntry]:
@@ -347,102 +422,103 @@ class AxisUnits(AxisComponentBase):
         unit_str: str | None, combobox: QComboBox
     ) -> AxisUnitEnum | None:
         """Fill *combobox* with pint units and return the matched enum type."""
+        if (
+            unit_str is None
+            or (match := _axis_type_by_label().get(unit_str)) is None
+        ):
+            with QSignalBlocker(combobox):
+                combobox.clear()
+            return None
+
+        axis_type, cfg = match
+        _set_combobox_items(combobox, _labeled_units(cfg))
+        # The match is made on the item labels, so no re-parse; a label
+        # missing from the cached rows leaves nothing selected rather than
+        # raising.  Selecting it mirrors the layer, so it must not be
+        # echoed back as a user edit.
         with QSignalBlocker(combobox):
-            combobox.clear()
-
-        for axis_type in AxisUnitEnum:
-            cfg = axis_type.config
-            if cfg is None:
-                continue
-            if unit_str is not None and unit_str in cfg.units:
-                ureg = pint.get_application_registry()
-                with QSignalBlocker(combobox):
-                    for pu in cfg.pint_units():
-                        combobox.addItem(str(pu), pu)
-                target = ureg.Unit(unit_str)
-                idx = combobox.findText(str(target))
-                combobox.setCurrentIndex(idx)
-                return axis_type
-
-        return None
+            combobox.setCurrentIndex(_unit_indices(cfg).get(unit_str, -1))
+        return axis_type
 
     def _sync_visibilities(self) -> None:
         """Toggle unit combobox / line-edit visibility per axis type."""
-        for i in range(len(self._type_comboboxes)):
-            axis_type = self._type_comboboxes[i].currentEnum()
-            show_combobox = axis_type != AxisUnitEnum.CUSTOM
-            self._unit_comboboxes[i].setVisible(show_combobox)
-            self._unit_line_edits[i].setVisible(not show_combobox)
-
-    def _sync_line_edit_texts(self) -> None:
-        """Update free-form line-edit texts from layer units."""
-        current_units = self._require_selected_layer().units
-        for i in range(min(len(self._unit_line_edits), len(current_units))):
-            with QSignalBlocker(self._unit_line_edits[i]):
-                self._unit_line_edits[i].setText(str(current_units[i]))
+        for type_cb, unit_cb, line_edit in zip(
+            self._type_comboboxes,
+            self._unit_comboboxes,
+            self._unit_line_edits,
+            strict=True,
+        ):
+            show_combobox = type_cb.currentEnum() != AxisUnitEnum.CUSTOM
+            unit_cb.setVisible(show_combobox)
+            line_edit.setVisible(not show_combobox)
+
+    def _sync_line_edit_texts(self, units: Sequence[pint.Unit]) -> None:
+        """Update free-form line-edit texts from the layer's *units*."""
+        for line_edit, unit in zip(self._unit_line_edits, units, strict=False):
+            with QSignalBlocker(line_edit):
+                line_edit.setText(_unit_str(unit))
 
     @staticmethod
     def _normalize_widget_unit_text(text: str) -> str:
         """Map empty or explicit reset text to napari's pixel default."""
         normalized = text.strip()
         return (
-            'pixel'
-            if not normalized or normalized.lower() == 'none'
-            else normalized
+            'pixel' if normalized.lower() in _RESET_UNIT_TEXTS else normalized
         )
 
-    def _write_units_to_layer(self) -> None:
-        """Collect current unit selections and apply to the layer."""
-        layer = self._require_selected_layer()
-        units: list[str] = []
-        for i in range(len(self._type_comboboxes)):
-            axis_type = self._type_comboboxes[i].currentEnum()
-            if axis_type == AxisUnitEnum.CUSTOM:
-                units.append(
-                    self._normalize_widget_unit_text(
-                        self._unit_line_edits[i].text()
-                    )
-                )
-            else:
-                units.append(
-                    self._normalize_widget_unit_text(
-                        self._unit_comboboxes[i].currentText()
-                    )
-                )
+    def _write_units_to_layer(self, layer: Layer) -> None:
+        """Collect current unit selections and apply them to *layer*."""
+        normalize = self._normalize_widget_unit_text
+        units = tuple(
+            normalize(
+                line_edit.text()
+                if type_cb.currentEnum() == AxisUnitEnum.CUSTOM
+                else unit_cb.currentText()
+            )
+            for type_cb, unit_cb, line_edit in zip(
+                self._type_comboboxes,
+                self._unit_comboboxes,
+                self._unit_line_edits,
+                strict=True,
+            )
+        )
         try:
-            layer.units = tuple(units)
+            layer.units = units
         except (AttributeError, ValueError) as e:
             show_warning(str(e))
-        self._sync_line_edit_texts()
+        self._sync_line_edit_texts(layer.units)
 
     def _on_type_changed(self) -> None:
         """Repopulate unit comboboxes when a type combobox changes."""
-        current_units = self._require_selected_layer().units
-        for i in range(len(self._type_comboboxes)):
-            axis_type = self._type_comboboxes[i].currentEnum()
+        layer = self._require_selected_layer()
+        current_units = layer.units
+        for i, (type_cb, unit_cb) in enumerate(
+            zip(self._type_comboboxes, self._unit_comboboxes, strict=True)
+        ):
+            axis_type = type_cb.currentEnum()
             config: _UnitConfig | None = (
                 None if axis_type is None else axis_type.config
             )
+            if config is None:
+                _set_combobox_items(unit_cb, ())
+                continue
             current_unit_str = (
-                str(current_units[i]) if i < len(current_units) else ''
+                _unit_str(current_units[i]) if i < len(current_units) else ''
             )
-            with QSignalBlocker(self._unit_comboboxes[i]):
-                self._unit_comboboxes[i].clear()
-                if config is None:
-                    idx = -1
-                else:
-                    for unit in config.units:
-                        self._unit_comboboxes[i].addItem(unit, unit)
-                idx = self._unit_comboboxes[i].findText(current_unit_str)
-                if idx == -1 and config is not None:
-                    idx = self._unit_comboboxes[i].findText(config.default)
-                self._unit_comboboxes[i].setCurrentIndex(idx)
-        self._write_units_to_layer()
+            _set_combobox_items(unit_cb, _labeled_units(config))
+            indices = _unit_indices(config)
+            with QSignalBlocker(unit_cb):
+                unit_cb.setCurrentIndex(
+                    indices.get(
+                        current_unit_str, indices.get(config.default, -1)
+                    )
+                )
+        self._write_units_to_layer(layer)
         self._sync_visibilities()
 
     def _on_unit_changed(self) -> None:
         """Handle unit combobox selection or line-edit change."""
-        self._write_units_to_layer()
+        self._write_units_to_layer(self._require_selected_layer())
         self._sync_visibilities()
 
 
@@ -460,10 +536,10 @@ class AxisMetadata(BoundLayerCoordinator):
 
     def __init__(self, parent_widget: QWidget) -> None:
         super().__init__()
-        self._labels = AxisLabels(
-            parent_widget,
-            on_labels_changed=self._on_labels_changed,
-        )
+        # No ``on_labels_changed`` callback: label edits are written to the
+        # bound layer, whose ``axis_labels`` event already reaches
+        # ``_on_labels_changed``.  Passing both propagated every edit twice.
+        self._labels = AxisLabels(parent_widget)
         self._translations = AxisTranslations(parent_widget)
         self._scales = AxisScales(parent_widget)
         self._units = AxisUnits(parent_widget)
@@ -482,6 +558,33 @@ class AxisMetadata(BoundLayerCoordinator):
         """All axis components in display order."""
         return list(self._components)
 
+    def iter_components(self) -> Iterator[AxisComponentBase]:
+        """Yield axis components in display order without copying."""
+        return iter(self._components)
+
+    def bind_layer(self, layer: Layer) -> None:
+        """Bind the coordinator and all components to *layer*.
+
+        Unlike the base coordinator, components are not unbound first:
+        each one swaps layers itself, keeping its per-axis widgets when
+        *layer* has the same number of axes.  Rebinding the layer already
+        bound resizes the rows of any component whose axis count no
+        longer matches, e.g. a layer kept bound while deselected whose
+        data changed dimensionality.
+        """
+        previous = self._selected_layer
+        if layer is previous:
+            for component in self._components:
+                if component.num_axes != layer.ndim:
+                    component.load_entries(layer)
+            return
+        if previous is not None:
+            self._disconnect_bound_layer_events(previous)
+        self._bind_layer_reference(layer)
+        for component in self._components:
+            component.bind_layer(layer)
+        self._connect_bound_layer_events(layer)
+
     def _connect_bound_layer_events(self, layer: Layer) -> None:
         """Connect model events for the bound *layer*."""
         layer.events.axis_labels.connect(self._on_labels_changed)
@@ -509,6 +612,17 @@ class AxisMetadata(BoundLayerCoordinator):
     def _on_units_changed(self) -> None:
         self._units._refresh_values(self._require_selected_layer())
 
+    def inherit_layer_properties(
+        self, template_layer: Layer, current_layer: Layer
+    ) -> None:
+        """Apply checked axis values from *template_layer* to *current_layer*.
+
+        The caller resolves *current_layer* once for all components.
+        Widgets bound to it pick up the new values through its events.
+        """
+        for c in self._components:
+            c.inherit_layer_properties(template_layer, current_layer)
+
     def set_checkboxes_visible(self, visible: bool) -> None:
         """Show or hide inheritance checkboxes on all components."""
         for c in self._components:
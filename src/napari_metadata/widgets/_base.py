@@ -16,12 +16,18 @@ old ``get_entries_dict`` API.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Iterator, Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, Protocol
 
-from qtpy.QtCore import Qt
-from qtpy.QtWidgets import QCheckBox, QLabel, QWidget
+import numpy as np
+from qtpy.QtCore import QSignalBlocker, Qt
+from qtpy.QtGui import QStandardItem, QStandardItemModel
+from qtpy.QtWidgets import QCheckBox, QComboBox, QLabel, QWidget
+
+from napari_metadata._qt_utils import _apply_tooltip, _bold_label
 
 if TYPE_CHECKING:
     from napari.layers import Layer
@@ -32,9 +38,60 @@ class _WidgetCollection(Protocol):
 
     def __iter__(self) -> Iterator[QWidget]: ...
 
+    def __len__(self) -> int: ...
+
+    def pop(self) -> QWidget: ...
+
     def clear(self) -> None: ...
 
 
+def _dispose_widgets(widgets: Iterable[QWidget], owner: QWidget) -> None:
+    """Silence, disconnect and schedule *widgets* for deletion together.
+
+    Signals are blocked before reparenting to prevent Qt focus-loss
+    events (e.g. ``editingFinished``) from reaching handlers while the
+    widgets are torn down.  All connections are also dropped so nothing
+    still queued before deletion can call back into a handler bound to
+    the previous layer.  The widgets are moved under one hidden child of
+    *owner* whose single ``deleteLater`` destroys them all, instead of
+    posting a deferred-delete event per widget.
+    """
+    graveyard = QWidget(owner)
+    for widget in widgets:
+        widget.blockSignals(True)
+        with suppress(TypeError, RuntimeError):
+            widget.disconnect()
+        widget.setParent(graveyard)
+    graveyard.deleteLater()
+
+
+def _set_combobox_items(
+    combobox: QComboBox, items: Iterable[tuple[str, object]]
+) -> None:
+    """Replace the items of *combobox* with ``(text, data)`` pairs.
+
+    The items are collected in a detached ``QStandardItemModel`` which is
+    then swapped in with a single ``setModel`` call, so the combobox and
+    its view are notified once rather than once per ``addItem``.  Nothing
+    is swapped when the combobox already lists the same items, e.g. when
+    a refresh keeps an axis on the same unit type.
+    """
+    items = tuple(items)
+    role = Qt.ItemDataRole.UserRole
+    if combobox.count() == len(items) and all(
+        combobox.itemText(i) == text and combobox.itemData(i, role) == data
+        for i, (text, data) in enumerate(items)
+    ):
+        return
+    model = QStandardItemModel(combobox)
+    for text, data in items:
+        item = QStandardItem(text)
+        item.setData(data, role)
+        model.appendRow(item)
+    with QSignalBlocker(combobox):
+        combobox.setModel(model)
+
+
 @dataclass
 class LayoutEntry:
     """One cell (or stacked group of widgets) in the axis grid layout.
@@ -58,6 +115,26 @@ class LayoutEntry:
     alignment: Qt.AlignmentFlag = Qt.AlignmentFlag.AlignVCenter
 
 
+@dataclass(frozen=True)
+class FlatLayoutRow:
+    """One axis row resolved to grid placements relative to its origin.
+
+    Parameters
+    ----------
+    cells : tuple[tuple[QWidget, int, int, int], ...]
+        ``(widget, col_offset, row_span, col_span)`` per widget, in the
+        order the row's ``LayoutEntry`` items list them.
+    row_span : int
+        Number of grid rows the row occupies.
+    col_span : int
+        Number of grid columns the row occupies.
+    """
+
+    cells: tuple[tuple[QWidget, int, int, int], ...]
+    row_span: int
+    col_span: int
+
+
 class ComponentBase(ABC):
     """Root abstract base for all metadata components.
 
@@ -85,8 +162,7 @@ class ComponentBase(ABC):
         super().__init__()
         self._parent_widget = parent_widget
 
-        self._component_qlabel = QLabel(self._label_text, parent=parent_widget)
-        self._component_qlabel.setStyleSheet('font-weight: bold')
+        self._component_qlabel = _bold_label(self._label_text, parent_widget)
         self._component_qlabel.setToolTip(self._tooltip_text)
 
     @property
@@ -129,6 +205,14 @@ class BoundLayerCoordinator(BoundLayerOwner, ABC):
     def components(self) -> Sequence[Any]:
         """All bound child components managed by this coordinator."""
 
+    def iter_components(self) -> Iterator[Any]:
+        """Yield child components in display order without copying them.
+
+        Subclasses that keep their components in an internal sequence
+        override this to iterate it directly.
+        """
+        yield from self.components
+
     def bind_layer(self, layer: Layer) -> None:
         """Bind the coordinator and all children to *layer*."""
         if layer is self._selected_layer:
@@ -136,7 +220,7 @@ class BoundLayerCoordinator(BoundLayerOwner, ABC):
         if self._selected_layer is not None:
             self.unbind_layer()
         self._bind_layer_reference(layer)
-        for component in self.components:
+        for component in self.iter_components():
             component.bind_layer(layer)
         self._connect_bound_layer_events(layer)
 
@@ -146,7 +230,7 @@ class BoundLayerCoordinator(BoundLayerOwner, ABC):
         if layer is not None:
             self._disconnect_bound_layer_events(layer)
         self._unbind_layer_reference()
-        for component in self.components:
+        for component in self.iter_components():
             component.unbind_layer()
 
     @abstractmethod
@@ -166,8 +250,10 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
 
     * **Widget lifecycle** — ``load_entries`` drives ``_create_widgets``
       (new layer) or ``_refresh_values`` (same layer).
-    * **Layout** — ``get_layout_entries`` returns a flat list of
-      ``LayoutEntry`` per axis, consumable by ``_main.py``'s grid builder.
+    * **Layout** — ``iter_layout_entries`` yields ``LayoutEntry`` items
+      per axis, consumed by ``_main.py``'s grid builder;
+      ``get_layout_entries`` returns them as a list and
+      ``flat_layout_row`` resolves them to grid placements.
     * **Inheritance** — ``inherit_layer_properties`` merges current and
       template layer values based on per-axis checkbox states.
     * **Cross-component sync** — ``update_axis_name_labels`` refreshes
@@ -185,6 +271,9 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
         super().__init__(parent_widget)
         self._axis_name_labels: list[QLabel] = []
         self._inherit_checkboxes: list[QCheckBox] = []
+        self._layout_rows: dict[int, tuple[LayoutEntry, ...]] = {}
+        self._flat_layout_rows: dict[int, FlatLayoutRow] = {}
+        self._widget_generation = 0
 
     # ------------------------------------------------------------------
     # Public API (consumed by _main.py / AxisMetadata coordinator)
@@ -195,20 +284,39 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
         """Number of per-axis widget rows currently alive (0 when empty)."""
         return len(self._axis_name_labels)
 
+    @property
+    def widget_generation(self) -> int:
+        """Counter bumped whenever per-axis widgets are created or removed.
+
+        Layouts holding the widgets are stale once it changes.
+        """
+        return self._widget_generation
+
     def load_entries(self, layer: Layer) -> None:
         """Refresh widgets for *layer*, binding first when needed."""
         if layer is not self._selected_layer:
             self.bind_layer(layer)
             return
+        if self.num_axes != layer.ndim:
+            self._resize_widgets(layer)
         self._refresh_values(layer)
 
     def bind_layer(self, layer: Layer) -> None:
-        """Bind this component to *layer* and create widgets if needed."""
+        """Bind this component to *layer* and create widgets if needed.
+
+        Widget handlers read the bound layer when they fire, so a layer
+        with the same number of axes reuses the existing widgets and only
+        loads its values into them.
+        """
         if layer is self._selected_layer and self.num_axes > 0:
             return
+        if self.num_axes > 0 and self.num_axes == layer.ndim:
+            self._bind_layer_reference(layer)
+            self._rebind_widgets(layer)
+            return
         self._clear_widgets()
         self._bind_layer_reference(layer)
-        self._create_widgets(layer)
+        self._create_widgets_batched(layer)
 
     def unbind_layer(self) -> None:
         """Clear widgets and remove any bound layer reference."""
@@ -224,18 +332,63 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
 
         Default: ``[name_label, *value_entries, inherit_checkbox]``.
         """
-        entries: list[LayoutEntry] = [
-            LayoutEntry(widgets=[self._axis_name_labels[axis_index]]),
-        ]
-        value_entries = self._get_value_entries(axis_index)
-        for entry in value_entries:
+        return list(self.iter_layout_entries(axis_index))
+
+    def iter_layout_entries(self, axis_index: int) -> Iterator[LayoutEntry]:
+        """Yield ``LayoutEntry`` items for one axis row.
+
+        Lazy counterpart of ``get_layout_entries`` used by the grid
+        builders, which consume each entry once.  Each row is built once
+        per widget set and reused by later page rebuilds.
+        """
+        row = self._layout_rows.get(axis_index)
+        if row is None:
+            row = self._layout_rows[axis_index] = tuple(
+                self._build_layout_row(axis_index)
+            )
+        return iter(row)
+
+    def flat_layout_row(self, axis_index: int) -> FlatLayoutRow:
+        """Return one axis row as placements relative to its grid origin.
+
+        The spans only depend on the component, so the grid builders
+        replay the cached placements instead of walking the entries of
+        every row on each page rebuild.
+        """
+        flat = self._flat_layout_rows.get(axis_index)
+        if flat is None:
+            cells: list[tuple[QWidget, int, int, int]] = []
+            col_offset = 0
+            row_span = 0
+            for entry in self.iter_layout_entries(axis_index):
+                cells.extend(
+                    (widget, col_offset, entry.row_span, entry.col_span)
+                    for widget in entry.widgets
+                )
+                col_offset += entry.col_span
+                row_span = max(row_span, entry.row_span)
+            flat = self._flat_layout_rows[axis_index] = FlatLayoutRow(
+                tuple(cells), row_span, col_offset
+            )
+        return flat
+
+    def _build_layout_row(self, axis_index: int) -> Iterator[LayoutEntry]:
+        """Yield the ``LayoutEntry`` items cached for one axis row.
+
+        Default: ``[name_label, *value_entries, inherit_checkbox]``, with
+        the component tooltip applied to the value widgets.
+        """
+        yield LayoutEntry(widgets=[self._axis_name_labels[axis_index]])
+        for entry in self._get_value_entries(axis_index):
             for widget in entry.widgets:
-                widget.setToolTip(self._tooltip_text)
-        entries.extend(value_entries)
-        entries.append(
-            LayoutEntry(widgets=[self._inherit_checkboxes[axis_index]]),
-        )
-        return entries
+                _apply_tooltip(widget, self._tooltip_text)
+            yield entry
+        yield LayoutEntry(widgets=[self._inherit_checkboxes[axis_index]])
+
+    def iter_widgets(self) -> Iterator[QWidget]:
+        """Yield every per-axis widget currently alive, in list order."""
+        for widget_list in self._widget_lists:
+            yield from widget_list
 
     def update_axis_name_labels(self, layer: Layer) -> None:
         """Refresh axis-name ``QLabel`` texts from *layer*.
@@ -259,18 +412,24 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
         """Merge current and template values based on checkbox states.
 
         Checked axes receive the template value; unchecked keep current.
-        The caller (``MetadataWidget.apply_inheritance_to_current_layer``)
-        is responsible for triggering a page rebuild after all components
-        have been updated.
+        With nothing checked the layer is left untouched, and with every
+        axis checked the template values are applied without merging.
+        Widgets are refreshed by the coordinator's layer-event handlers,
+        so no rebuild is needed afterwards.
         """
-        current_values = self._get_layer_values(current_layer)
-        template_values = self._get_layer_values(template_layer)
-        merged: list[Any] = [
-            tv if self._inherit_checkboxes[i].isChecked() else cv
-            for i, (cv, tv) in enumerate(
-                zip(current_values, template_values, strict=True)
+        mask = self._inherit_mask()
+        if not mask.any():
+            return
+        if mask.all():
+            self._apply_values(
+                current_layer, list(self._get_layer_values(template_layer))
             )
-        ]
+            return
+        merged = self._merge_values(
+            mask,
+            self._get_layer_values(current_layer),
+            self._get_layer_values(template_layer),
+        )
         self._apply_values(current_layer, merged)
 
     # ------------------------------------------------------------------
@@ -301,10 +460,33 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
     def _apply_values(self, layer: Layer, values: list) -> None:
         """Write merged axis property values to *layer*."""
 
+    def _merge_values(
+        self, mask: np.ndarray, current_values: tuple, template_values: tuple
+    ) -> list[Any]:
+        """Pick template values where *mask* is set, current values elsewhere.
+
+        The default works for arbitrary objects (labels, pint units).
+        Numeric components override this with a vectorized ``np.where``.
+        """
+        return [
+            tv if m else cv
+            for m, cv, tv in zip(
+                mask, current_values, template_values, strict=True
+            )
+        ]
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _inherit_mask(self) -> np.ndarray:
+        """Return a boolean array of inherit-checkbox states, one per axis."""
+        return np.fromiter(
+            (cb.isChecked() for cb in self._inherit_checkboxes),
+            dtype=bool,
+            count=len(self._inherit_checkboxes),
+        )
+
     def _all_widget_lists(self) -> list[_WidgetCollection]:
         """Return all per-axis widget lists for cleanup.
 
@@ -314,19 +496,75 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
         """
         return [self._axis_name_labels, self._inherit_checkboxes]
 
-    def _clear_widgets(self) -> None:
-        """Block signals and destroy all per-axis widgets.
+    @cached_property
+    def _widget_lists(self) -> tuple[_WidgetCollection, ...]:
+        """Per-axis widget lists, collected once from ``_all_widget_lists``.
 
-        Signals are blocked before ``setParent(None)`` to prevent Qt
-        focus-loss events (e.g. ``editingFinished``) from reaching
-        handlers while widgets are being torn down.
+        The lists are only ever mutated in place (``append`` / ``clear``),
+        never reassigned, so the cached references stay valid for the
+        lifetime of the component.
         """
-        for widget_list in self._all_widget_lists():
-            for w in widget_list:
-                w.blockSignals(True)
-                w.setParent(None)
-                w.deleteLater()
+        return tuple(self._all_widget_lists())
+
+    def _clear_widgets(self) -> None:
+        """Destroy all per-axis widgets and empty their lists."""
+        _dispose_widgets(self.iter_widgets(), self._parent_widget)
+        for widget_list in self._widget_lists:
             widget_list.clear()
+        self._layout_rows.clear()
+        self._flat_layout_rows.clear()
+        self._widget_generation += 1
+
+    def _resize_widgets(self, layer: Layer) -> None:
+        """Match the per-axis widget rows to a bound layer whose ndim changed.
+
+        Reached through ``load_entries`` when ``AxisMetadata`` rebinds the
+        layer it already holds.
+
+        When axes were removed only the trailing rows are destroyed and
+        the remaining widgets are kept for ``_refresh_values``.  Added
+        axes need new widgets wired up by ``_create_widgets``, so the
+        rows are rebuilt in that case.
+        """
+        if layer.ndim > self.num_axes:
+            self._clear_widgets()
+            self._create_widgets_batched(layer)
+            return
+        for axis_index in range(layer.ndim, self.num_axes):
+            self._layout_rows.pop(axis_index, None)
+            self._flat_layout_rows.pop(axis_index, None)
+        removed: list[QWidget] = []
+        for widget_list in self._widget_lists:
+            while len(widget_list) > layer.ndim:
+                removed.append(widget_list.pop())
+        self._widget_generation += 1
+        _dispose_widgets(removed, self._parent_widget)
+
+    def _rebind_widgets(self, layer: Layer) -> None:
+        """Load a newly bound *layer* into the existing per-axis widgets.
+
+        Mirrors a fresh ``_create_widgets``: names and values come from
+        *layer* and every inherit checkbox starts checked again.
+        """
+        for cb in self._inherit_checkboxes:
+            cb.setChecked(True)
+        self.update_axis_name_labels(layer)
+        self._refresh_values(layer)
+
+    def _create_widgets_batched(self, layer: Layer) -> None:
+        """Run ``_create_widgets`` with repaints of the parent suspended.
+
+        Every per-axis widget is created as a child of the parent widget,
+        so updates are held off until the whole set exists.
+        """
+        parent = self._parent_widget
+        was_enabled = parent.updatesEnabled()
+        parent.setUpdatesEnabled(False)
+        try:
+            self._create_widgets(layer)
+        finally:
+            parent.setUpdatesEnabled(was_enabled)
+        self._widget_generation += 1
 
     def _create_axis_name_labels(self, layer: Layer) -> None:
         """Create per-axis name QLabels from the layer's axis labels.
@@ -335,21 +573,24 @@ class AxisComponentBase(BoundLayerOwner, ComponentBase):
         the label is empty.
         """
         labels = layer.axis_labels
+        parent = self._parent_widget
+        center = Qt.AlignmentFlag.AlignCenter
+        append = self._axis_name_labels.append
         for i, label in enumerate(labels):
-            qlabel = QLabel(
-                label if label else str(i),
-                parent=self._parent_widget,
-            )
-            qlabel.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._axis_name_labels.append(qlabel)
+            qlabel = QLabel(label if label else str(i), parent=parent)
+            qlabel.setAlignment(center)
+            append(qlabel)
 
     def _create_inherit_checkboxes(self, layer: Layer) -> None:
         """Create one inherit ``QCheckBox`` per axis (all checked)."""
+        parent = self._parent_widget
+        no_focus = Qt.FocusPolicy.NoFocus
+        append = self._inherit_checkboxes.append
         for _ in range(layer.ndim):
-            cb = QCheckBox('', parent=self._parent_widget)
+            cb = QCheckBox('', parent=parent)
             cb.setChecked(True)
-            cb.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            self._inherit_checkboxes.append(cb)
+            cb.setFocusPolicy(no_focus)
+            append(cb)
 
 
 class FileComponentBase(ComponentBase):
@@ -394,7 +635,7 @@ class FileComponentBase(ComponentBase):
 
     def load_entries(self, layer: Layer) -> None:
         """Update the display for *layer*."""
-        self.value_widget.setToolTip(self._tooltip_text)
+        _apply_tooltip(self.value_widget, self._tooltip_text)
         self._update_display(layer)
 
     def bind_layer(self, layer: Layer) -> None:
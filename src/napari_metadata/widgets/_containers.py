@@ -19,10 +19,11 @@ vertical ``CollapsibleSectionContainer``.
 
 from __future__ import annotations
 
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 
-from qtpy.QtCore import QEvent, QObject, QSize, Qt
-from qtpy.QtGui import QWheelEvent
+from qtpy.QtCore import QEvent, QObject, QSignalBlocker, QSize, Qt, Slot
+from qtpy.QtGui import QTransform, QWheelEvent
 from qtpy.QtWidgets import (
     QHBoxLayout,
     QPushButton,
@@ -43,12 +44,19 @@ if TYPE_CHECKING:
 #: rightward.  This alias is the single source of truth for both modules.
 Orientation = Literal['vertical', 'horizontal']
 
+#: Button-text prefixes marking a collapsed (▶) or expanded (▼) section.
+_INDICATOR_COLLAPSED = '\u25b6 '
+_INDICATOR_EXPANDED = '\u25bc '
+
 
 class _ContentScrollArea(QScrollArea):
     """Scroll area whose size hint tracks its content widget.
 
     This lets the parent layout size the expanded section from the content's
-    natural size without manually pinning fixed dimensions.
+    natural size without manually pinning fixed dimensions.  The content's
+    hints, adjusted for the frame, are cached until its layout (or the
+    viewport) requests a new layout pass or the style or frame changes, so
+    repeated geometry queries do not walk the content tree.
     """
 
     def __init__(
@@ -56,32 +64,81 @@ class _ContentScrollArea(QScrollArea):
     ):
         super().__init__(parent)
         self._orientation = orientation
+        self._cached_hints: tuple[QSize, QSize] | None = None
+
+    def setWidget(self, widget: QWidget | None) -> None:
+        self.invalidate_size_cache()
+        super().setWidget(widget)
+
+    def takeWidget(self) -> QWidget | None:
+        self.invalidate_size_cache()
+        return super().takeWidget()
+
+    def invalidate_size_cache(self) -> None:
+        """Forget the cached hints and notify the parent layout."""
+        self._cached_hints = None
+        self.updateGeometry()
+
+    def eventFilter(self, a0, a1) -> bool:
+        # QScrollArea installs itself as a filter on the content widget; a
+        # layout request there means the content's hints may have changed.
+        if (
+            a1 is not None
+            and a1.type() == QEvent.Type.LayoutRequest
+            and a0 is self.widget()
+        ):
+            self.invalidate_size_cache()
+        return super().eventFilter(a0, a1)
+
+    def viewportEvent(self, a0) -> bool:
+        # Content widgets without a layout post their requests here.
+        if a0 is not None and a0.type() == QEvent.Type.LayoutRequest:
+            self.invalidate_size_cache()
+        return super().viewportEvent(a0)
+
+    def changeEvent(self, a0) -> None:
+        # The frame width feeds the cached hints and follows the style and
+        # the frame settings (which update the contents margins).
+        if a0 is not None and a0.type() in (
+            QEvent.Type.StyleChange,
+            QEvent.Type.ContentsRectChange,
+        ):
+            self._cached_hints = None
+        super().changeEvent(a0)
+
+    def _area_hints(self, widget: QWidget) -> tuple[QSize, QSize]:
+        """Return the area's ``(sizeHint, minimumSizeHint)``, cached."""
+        if self._cached_hints is None:
+            hint = widget.sizeHint()
+            min_hint = widget.minimumSizeHint()
+            frame = 2 * self.frameWidth()
+            if self._orientation == 'vertical':
+                # Minimum width (parent stretches horizontally) but preferred
+                # height (avoid inner scrolling when possible).
+                self._cached_hints = (
+                    QSize(min_hint.width() + frame, hint.height() + frame),
+                    QSize(0, min_hint.height() + frame),
+                )
+            else:
+                # Horizontal: preferred width; zero height (parent controls
+                # it).
+                self._cached_hints = (
+                    QSize(hint.width() + frame, 0),
+                    QSize(0, 0),
+                )
+        return self._cached_hints
 
     def sizeHint(self) -> QSize:
         widget = self.widget()
         if widget is None:
             return super().sizeHint()
-
-        hint = widget.sizeHint()
-        frame = 2 * self.frameWidth()
-        if self._orientation == 'vertical':
-            # Minimum width (parent stretches horizontally) but preferred
-            # height (avoid inner scrolling when possible).
-            min_hint = widget.minimumSizeHint()
-            return QSize(min_hint.width() + frame, hint.height() + frame)
-        # Horizontal: preferred width; zero height (parent controls it).
-        return QSize(hint.width() + frame, 0)
+        return QSize(self._area_hints(widget)[0])
 
     def minimumSizeHint(self) -> QSize:
         widget = self.widget()
         if widget is None:
             return super().minimumSizeHint()
-
-        hint = widget.minimumSizeHint()
-        frame = 2 * self.frameWidth()
-        if self._orientation == 'vertical':
-            return QSize(0, hint.height() + frame)
-        return QSize(0, 0)
+        return QSize(self._area_hints(widget)[1])
 
 
 class CollapsibleSectionContainer(QWidget):
@@ -116,6 +173,8 @@ class CollapsibleSectionContainer(QWidget):
         self._on_toggle_callback = on_toggle
         self._orientation = orientation
         self._title = title
+        self._collapsed_text = _INDICATOR_COLLAPSED + title
+        self._expanded_text = _INDICATOR_EXPANDED + title
         self.setSizePolicy(
             QSizePolicy.Policy.Expanding,
             QSizePolicy.Policy.Maximum
@@ -150,44 +209,39 @@ class CollapsibleSectionContainer(QWidget):
 
         # Expanding content area
         self._expanding_area = _ContentScrollArea(orientation, self)
+        self._expanding_area.setWidgetResizable(True)
+        self._expanding_area.setVerticalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        )
+        self._expanding_area.setHorizontalScrollBarPolicy(
+            Qt.ScrollBarPolicy.ScrollBarAsNeeded
+        )
 
         if orientation == 'vertical':
-            self._expanding_area.setWidgetResizable(True)
-            self._expanding_area.setVerticalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAsNeeded
-            )
-            self._expanding_area.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAsNeeded
-            )
             # Prevent the horizontal scrollbar from consuming mouse-wheel events
             # that should scroll the outer container.
-            self._wheel_filter = DisableWheelScrollingFilter()
             h_scrollbar = self._expanding_area.horizontalScrollBar()
             if h_scrollbar is not None:
-                h_scrollbar.installEventFilter(self._wheel_filter)
+                h_scrollbar.installEventFilter(_wheel_blocker())
             self._expanding_area.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Maximum
             )
         else:  # horizontal
-            self._expanding_area.setWidgetResizable(True)
-            self._expanding_area.setVerticalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAsNeeded
-            )
-            self._expanding_area.setHorizontalScrollBarPolicy(
-                Qt.ScrollBarPolicy.ScrollBarAsNeeded
-            )
             self._expanding_area.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding
             )
 
         self._expanding_area.setVisible(False)
+        # Horizontal sections keep one top-aligning wrapper for their content.
+        self._wrapper_layout: QVBoxLayout | None = None
+        self._content_widget: QWidget | None = None
         # Stretch factor 1 for horizontal so the content area fills available space
         self._layout.addWidget(
             self._expanding_area, 0 if orientation == 'vertical' else 1
         )
 
         # Initialise button text with the collapsed indicator.
-        self._button.setText(f'\u25b6 {title}')
+        self._button.setText(self._collapsed_text)
 
     # ------------------------------------------------------------------
     # Public API
@@ -198,27 +252,44 @@ class CollapsibleSectionContainer(QWidget):
 
         The previous content widget, if any, is scheduled for deletion.
         For horizontal sections a wrapper with a vertical stretch is inserted
-        automatically so the content stays top-aligned.
+        automatically so the content stays top-aligned; the wrapper is built
+        once and later calls only swap the widget inside it.
         """
-        old = self._expanding_area.takeWidget()
-        if old is not None:
-            old.deleteLater()
-
         if self._orientation == 'vertical':
+            old = self._expanding_area.takeWidget()
+            if old is not None:
+                old.deleteLater()
             widget.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
             )
             self._expanding_area.setWidget(widget)
-        else:  # horizontal — wrap to keep content top-aligned
+            return
+
+        # horizontal — wrap to keep content top-aligned
+        old = self._content_widget
+        if old is not None and self._wrapper_layout is not None:
+            self._wrapper_layout.replaceWidget(old, widget)
+            old.hide()
+            old.deleteLater()
+        else:
             wrapper = QWidget(self._expanding_area)
             wrapper.setSizePolicy(
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
             )
-            wrapper_layout = QVBoxLayout(wrapper)
-            wrapper_layout.setContentsMargins(0, 0, 0, 0)
-            wrapper_layout.addWidget(widget)
-            wrapper_layout.addStretch(1)
+            self._wrapper_layout = QVBoxLayout(wrapper)
+            self._wrapper_layout.setContentsMargins(0, 0, 0, 0)
+            self._wrapper_layout.addWidget(widget)
+            self._wrapper_layout.addStretch(1)
             self._expanding_area.setWidget(wrapper)
+        self._content_widget = widget
+
+    def invalidate_size_cache(self) -> None:
+        """Recompute the content size hints on the next geometry query.
+
+        Content layout changes invalidate the cache automatically; this is
+        for callers that change the content's hints by other means.
+        """
+        self._expanding_area.invalidate_size_cache()
 
     def isExpanded(self) -> bool:
         """Return ``True`` if the section is currently expanded."""
@@ -230,7 +301,13 @@ class CollapsibleSectionContainer(QWidget):
         Equivalent to clicking the toggle button; the ``on_toggle`` callback
         and button-text update are performed automatically.
         """
-        self._button.setChecked(checked)
+        if checked == self._button.isChecked():
+            return
+        # Update the button silently and run the handler directly rather
+        # than round-tripping through the ``toggled`` signal.
+        with QSignalBlocker(self._button):
+            self._button.setChecked(checked)
+        self._on_button_toggled(checked)
 
     def sizeHint(self) -> QSize:
         return self._section_size_hint(minimum=False)
@@ -273,24 +350,24 @@ class CollapsibleSectionContainer(QWidget):
     # ------------------------------------------------------------------
 
     def _section_size_hint(self, *, minimum: bool) -> QSize:
+        button = self._button
+        layout = self._layout
+        expanded = button.isChecked()
         button_hint = (
-            self._button.minimumSizeHint()
-            if minimum
-            else self._button.sizeHint()
+            button.minimumSizeHint() if minimum else button.sizeHint()
         )
-        if not self._button.isChecked():
+        if not expanded:
             content_hint = QSize(0, 0)
         else:
+            area = self._expanding_area
             content_hint = (
-                self._expanding_area.minimumSizeHint()
-                if minimum
-                else self._expanding_area.sizeHint()
+                area.minimumSizeHint() if minimum else area.sizeHint()
             )
 
-        margins = self._layout.contentsMargins()
+        margins = layout.contentsMargins()
         width = margins.left() + margins.right()
         height = margins.top() + margins.bottom()
-        spacing = self._layout.spacing() if self._button.isChecked() else 0
+        spacing = layout.spacing() if expanded else 0
 
         if self._orientation == 'vertical':
             width += max(button_hint.width(), content_hint.width())
@@ -301,6 +378,7 @@ class CollapsibleSectionContainer(QWidget):
 
         return QSize(width, height)
 
+    @Slot(bool)
     def _on_button_toggled(self, checked: bool) -> None:
         """Respond to the toggle button state change."""
         self._expanding_area.setVisible(checked)
@@ -308,43 +386,78 @@ class CollapsibleSectionContainer(QWidget):
         if self._on_toggle_callback is not None:
             self._on_toggle_callback(checked)
 
-        indicator = '\u25bc' if checked else '\u25b6'
-        self._button.setText(f'{indicator} {self._title}')
-        self._expanding_area.updateGeometry()
+        self._button.setText(
+            self._expanded_text if checked else self._collapsed_text
+        )
+        # Showing/hiding the content area already invalidates its geometry,
+        # and updateGeometry() posts a layout request to the parent's layout,
+        # so one call here is enough for the change to propagate upward.
         self.updateGeometry()
-        parent = self.parentWidget()
-        if parent is not None:
-            parent.updateGeometry()
 
 
 class RotatedButton(QPushButton):
     """A ``QPushButton`` that renders its label rotated 90° counterclockwise.
 
     Used as the header button for horizontal ``CollapsibleSectionContainer``
-    instances, keeping the button narrow while still readable.
+    instances, keeping the button narrow while still readable.  The
+    transposed size hint is cached until the text, font, style or contents
+    margins change.
     """
 
+    _INVALIDATING_EVENTS = frozenset(
+        {
+            QEvent.Type.FontChange,
+            QEvent.Type.StyleChange,
+            QEvent.Type.ContentsRectChange,
+        }
+    )
+
     def __init__(self, text: str, parent: QWidget | None = None) -> None:
+        self._cached_size_hint: QSize | None = None
+        # Reused across paints; initStyleOption() fully re-populates it.
+        self._style_option = QStyleOptionButton()
+        # Rotation into the button's frame, keyed on the height it uses.
+        self._cached_transform: tuple[int, QTransform] | None = None
         super().__init__(text, parent)
         self.setSizePolicy(
             QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding
         )
 
+    def setText(self, text: str | None) -> None:
+        self._cached_size_hint = None
+        super().setText(text)
+
+    def changeEvent(self, e) -> None:
+        if e is not None and e.type() in self._INVALIDATING_EVENTS:
+            self._cached_size_hint = None
+        super().changeEvent(e)
+
+    def _paint_transform(self) -> QTransform:
+        height = self.height()
+        cached = self._cached_transform
+        if cached is None or cached[0] != height:
+            transform = QTransform().rotate(-90).translate(-height, 0)
+            cached = self._cached_transform = (height, transform)
+        return cached[1]
+
     def paintEvent(self, a0) -> None:
         painter = QStylePainter(self)
-        painter.rotate(-90)
-        painter.translate(-self.height(), 0)
+        painter.setTransform(self._paint_transform())
 
-        opt = QStyleOptionButton()
+        # Pressed/checked/hover state changes without a changeEvent, so the
+        # option is re-initialised on every paint rather than cached.
+        opt = self._style_option
         self.initStyleOption(opt)
         opt.rect = opt.rect.transposed()
 
         painter.drawControl(QStyle.ControlElement.CE_PushButton, opt)
 
-    def sizeHint(self):
-        return super().sizeHint().transposed()
+    def sizeHint(self) -> QSize:
+        if self._cached_size_hint is None:
+            self._cached_size_hint = super().sizeHint().transposed()
+        return QSize(self._cached_size_hint)
 
-    def minimumSizeHint(self):
+    def minimumSizeHint(self) -> QSize:
         return self.sizeHint()
 
 
@@ -353,14 +466,25 @@ class HorizontalOnlyOuterScrollArea(QScrollArea):
 
     Used as the outermost scroll area in horizontal dock layouts.  The child is
     pinned to the viewport height (no vertical scroll) and wheel events are
-    passed to the parent so the outer container can handle them.
+    passed to the parent so the outer container can handle them.  Width-only
+    resizes leave the child's fixed height (and its layout) untouched.
     """
 
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._pinned: tuple[QWidget, int] | None = None
+
     def resizeEvent(self, a0) -> None:
         super().resizeEvent(a0)
         w = self.widget()
-        if w is not None:
-            w.setFixedHeight(self.viewport().height())
+        if w is None:
+            return
+        height = self.viewport().height()
+        pinned = self._pinned
+        if pinned is not None and pinned[0] is w and pinned[1] == height:
+            return
+        w.setFixedHeight(height)
+        self._pinned = (w, height)
 
     def wheelEvent(self, a0: QWheelEvent | None) -> None:
         if a0 is not None:
@@ -374,5 +498,17 @@ class DisableWheelScrollingFilter(QObject):
     accidentally scrolling that bar.
     """
 
+    _WHEEL = QEvent.Type.Wheel
+
     def eventFilter(self, a0, a1) -> bool:
-        return bool(a1 is not None and a1.type() == QEvent.Type.Wheel)
+        return a1 is not None and a1.type() == self._WHEEL
+
+
+@cache
+def _wheel_blocker() -> DisableWheelScrollingFilter:
+    """Return the filter shared by every vertical section's scrollbar.
+
+    The filter is stateless, so one instance serves all sections.  It is
+    created lazily so that importing this module does not create QObjects.
+    """
+    return DisableWheelScrollingFilter()
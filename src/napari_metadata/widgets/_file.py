@@ -39,6 +39,8 @@ from napari_metadata.widgets._base import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from napari.layers import Layer
 
 
@@ -60,6 +62,9 @@ class LayerName(BoundFileComponentBase):
                 QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred
             )
         )
+        # Text last pushed from the layer, so focus-outs without an edit
+        # return before touching the layer.
+        self._last_displayed_text: str | None = None
 
     def _connect_bound_layer_signals(self) -> None:
         self._line_edit.editingFinished.connect(self._on_name_changed)
@@ -69,6 +74,7 @@ class LayerName(BoundFileComponentBase):
             self._line_edit.editingFinished.disconnect(self._on_name_changed)
 
     def _clear_bound_display(self) -> None:
+        self._last_displayed_text = None
         with QSignalBlocker(self._line_edit):
             self._line_edit.setText('')
 
@@ -80,11 +86,20 @@ class LayerName(BoundFileComponentBase):
         return layer.name
 
     def _update_display(self, layer: Layer) -> None:
-        self._line_edit.setText(self._get_display_text(layer))
+        text = self._get_display_text(layer)
+        # QLineEdit.setText resets the cursor and undo history even when the
+        # text is unchanged.  Text pushed from the layer is not an edit, so
+        # it is not announced to listeners either.
+        if self._line_edit.text() != text:
+            with QSignalBlocker(self._line_edit):
+                self._line_edit.setText(text)
+        self._last_displayed_text = text
 
     def _on_name_changed(self) -> None:
         """Write the edited name back to the active layer."""
         text = self._line_edit.text()
+        if text == self._last_displayed_text:
+            return
         layer = self._require_selected_layer()
         if text == layer.name:
             return
@@ -179,7 +194,8 @@ class SourcePath(_SourceAttributeComponent):
         return self._path_line_edit
 
     def _set_display_value(self, text: str) -> None:
-        self._path_line_edit.setText(text)
+        if self._path_line_edit.text() != text:
+            self._path_line_edit.setText(text)
 
     def clear(self) -> None:
         self.set_visible(False)
@@ -238,7 +254,7 @@ class FileGeneralMetadata(BoundLayerCoordinator):
         self._source_widget = SourceWidget(parent_widget)
         self._source_parent = SourceParent(parent_widget)
 
-        self._components: list[FileComponentBase] = [
+        self._components: tuple[FileComponentBase, ...] = (
             self._layer_name,
             self._layer_shape,
             self._layer_dtype,
@@ -248,7 +264,13 @@ class FileGeneralMetadata(BoundLayerCoordinator):
             self._source_sample,
             self._source_widget,
             self._source_parent,
-        ]
+        )
+        # Components whose display depends on ``layer.data``.
+        self._data_components: tuple[FileComponentBase, ...] = (
+            self._layer_shape,
+            self._layer_dtype,
+            self._file_size,
+        )
 
     def _connect_bound_layer_events(self, layer: Layer) -> None:
         """Connect model events for the bound *layer*."""
@@ -263,20 +285,19 @@ class FileGeneralMetadata(BoundLayerCoordinator):
             layer.events.data.disconnect(self._on_data_changed)
 
     def _on_name_changed(self) -> None:
-        layer = self._require_selected_layer()
-        for component in self._components:
-            component.load_entries(layer)
+        # Only ``LayerName`` shows the bound layer's own name.
+        self._layer_name.load_entries(self._require_selected_layer())
 
     def _on_data_changed(self) -> None:
         layer = self._require_selected_layer()
-        for component in (
-            self._layer_shape,
-            self._layer_dtype,
-            self._file_size,
-        ):
+        for component in self._data_components:
             component.load_entries(layer)
 
     @property
     def components(self) -> list[FileComponentBase]:
         """All file components in display order."""
         return list(self._components)
+
+    def iter_components(self) -> Iterator[FileComponentBase]:
+        """Yield file components in display order without copying."""
+        return iter(self._components)
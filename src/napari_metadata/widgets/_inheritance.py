@@ -13,6 +13,9 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
+from napari_metadata._qt_utils import _bold_label
+from napari_metadata.widgets._base import _set_combobox_items
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -36,6 +39,12 @@ class InheritanceWidget(QWidget):
         self._inheriting_layer: Layer | None = None
         self._on_apply_inheritance = on_apply_inheritance
         self._event_connected_layer: Layer | None = None
+        # What the combobox and inheriting label were last built from, so
+        # events that leave them unchanged can return early.
+        self._combobox_layers: tuple[Layer, ...] | None = None
+        self._combobox_names: tuple[str, ...] = ()
+        self._combobox_rows: dict[int, int] = {}
+        self._inheriting_key: tuple[Layer | None, str | None] | None = None
 
         self._layout: QVBoxLayout = QVBoxLayout()
         self.setLayout(self._layout)
@@ -51,26 +60,21 @@ class InheritanceWidget(QWidget):
             )
         )
 
-        self._template_layer_label = QLabel('Copy from template layer')
+        self._template_layer_label = _bold_label('Copy from template layer')
         self._template_layer_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self._template_layer_label.setStyleSheet('font-weight: bold;')
 
         self._template_combobox: QComboBox = QComboBox()
         self._template_combobox.currentIndexChanged.connect(
             self._on_combobox_selection_changed
         )
 
-        self._inheriting_layer_label: QLabel = QLabel('Copy to layer')
+        self._inheriting_layer_label: QLabel = _bold_label('Copy to layer')
         self._inheriting_layer_label.setAlignment(Qt.AlignmentFlag.AlignLeft)
-        self._inheriting_layer_label.setStyleSheet('font-weight: bold')
 
         self._inheriting_layer_name: QLabel = QLabel('None selected')
 
-        self._different_dims_label: QLabel = QLabel(
-            'Layers dimensions do not match'
-        )
-        self._different_dims_label.setStyleSheet(
-            'color: red; font-weight: bold;'
+        self._different_dims_label: QLabel = _bold_label(
+            'Layers dimensions do not match', color='red'
         )
         self._different_dims_label.setVisible(False)
 
@@ -92,9 +96,6 @@ class InheritanceWidget(QWidget):
         self._layers.events.removed.connect(self._update_layers_combobox)
         self._layers.events.changed.connect(self._update_layers_combobox)
 
-        self._layers.selection.events.active.connect(
-            self._update_inheriting_label
-        )
         self._layers.selection.events.active.connect(
             self._on_layer_selection_changed
         )
@@ -103,36 +104,70 @@ class InheritanceWidget(QWidget):
         self._update_inheriting_label()
 
     def _update_layers_combobox(self) -> None:
-        layers_list: list[Layer] = list(self._layers)
-        with QSignalBlocker(self._template_combobox):
-            self._template_combobox.clear()
-        if not len(layers_list):
-            self._template_layer = None
+        layers = tuple(self._layers)
+        names = tuple(layer.name for layer in layers)
+        combobox = self._template_combobox
+        template_layer = self._template_layer
+        previous = self._combobox_layers
+        if (
+            previous is not None
+            # Equal name tuples imply equal lengths for the zip below.
+            and names == self._combobox_names
+            and all(a is b for a, b in zip(previous, layers, strict=True))
+            and (not layers or combobox.currentData() is template_layer)
+        ):
             return
-        with QSignalBlocker(self._template_combobox):
-            self._template_combobox.addItem('None', userData=None)
-            for setting_layer in layers_list:
-                self._template_combobox.addItem(
-                    setting_layer.name, userData=setting_layer
-                )
-            idx = self._template_combobox.findData(
-                self._template_layer, Qt.ItemDataRole.UserRole
-            )
-            if idx == -1:
+        self._combobox_layers = layers
+        self._combobox_names = names
+        with QSignalBlocker(combobox):
+            if not layers:
+                combobox.clear()
+                self._combobox_rows = {}
                 self._template_layer = None
-                idx = self._template_combobox.findData(
-                    None, Qt.ItemDataRole.UserRole
-                )
-            self._template_combobox.setCurrentIndex(idx)
+                return
+            # Row 0 is always the 'None' entry.  Rows are keyed by layer
+            # identity; ``_combobox_layers`` keeps the layers (and so their
+            # ids) alive for as long as the map is used.
+            items: list[tuple[str, Layer | None]] = [('None', None)]
+            rows = {id(None): 0}
+            for row, (setting_layer, name) in enumerate(
+                zip(layers, names, strict=True), start=1
+            ):
+                items.append((name, setting_layer))
+                rows[id(setting_layer)] = row
+            self._combobox_rows = rows
+            target_index = rows.get(id(template_layer), 0)
+            if target_index == 0:
+                self._template_layer = None
+            # Swap the model and restore the selection as one repaint.
+            was_enabled = combobox.updatesEnabled()
+            combobox.setUpdatesEnabled(False)
+            try:
+                _set_combobox_items(combobox, items)
+                combobox.setCurrentIndex(target_index)
+            finally:
+                combobox.setUpdatesEnabled(was_enabled)
 
     def _update_inheriting_label(self) -> None:
-        active_layer: Layer | None = self._layers.selection.active
-        if active_layer is None:
-            self._inheriting_layer_name.setText('None selected')
-            self._inheriting_layer = None
-            self._compare_template_and_inheriting_layers()
-            return
-        self._inheriting_layer_name.setText(active_layer.name)
+        self._show_inheriting_layer(self._layers.selection.active)
+
+    def _show_inheriting_layer(self, active_layer: Layer | None) -> None:
+        key = (
+            active_layer,
+            active_layer.name if active_layer is not None else None,
+        )
+        # The label only changes with the layer or its name, but the
+        # dimension check is re-run every time: ndim can change without
+        # either.
+        if (
+            self._inheriting_key is None
+            or key[0] is not self._inheriting_key[0]
+            or key[1] != self._inheriting_key[1]
+        ):
+            self._inheriting_key = key
+            self._inheriting_layer_name.setText(
+                'None selected' if active_layer is None else active_layer.name
+            )
         self._inheriting_layer = active_layer
         self._compare_template_and_inheriting_layers()
 
@@ -170,18 +205,44 @@ class InheritanceWidget(QWidget):
             self._on_apply_inheritance(template_layer)
 
     def _on_combobox_selection_changed(self) -> None:
-        selected_item: Layer | None = self._template_combobox.currentData(
-            Qt.ItemDataRole.UserRole
-        )
+        # currentData() reads Qt.ItemDataRole.UserRole by default.
+        selected_item: Layer | None = self._template_combobox.currentData()
         self._template_layer = selected_item
         self._compare_template_and_inheriting_layers()
 
     def _on_layer_name_changed(self) -> None:
-        self._update_layers_combobox()
-        self._update_inheriting_label()
+        # Only the active (inheriting) layer's name events are connected,
+        # so the renamed layer is already known.
+        layer = self._event_connected_layer
+        if not self._rename_combobox_row(layer):
+            self._update_layers_combobox()
+        self._show_inheriting_layer(layer)
+
+    def _rename_combobox_row(self, layer: Layer | None) -> bool:
+        """Update the row text for a renamed *layer* in place.
+
+        Returns ``False`` if the combobox does not list *layer*, in which
+        case the caller falls back to a full rebuild.
+        """
+        if layer is None:
+            return False
+        row = self._combobox_rows.get(id(layer), 0)
+        if row == 0:
+            return False
+        name = layer.name
+        names = list(self._combobox_names)
+        # Row 0 is the 'None' entry.
+        names[row - 1] = name
+        self._combobox_names = tuple(names)
+        with QSignalBlocker(self._template_combobox):
+            self._template_combobox.setItemText(row, name)
+        return True
 
     def _on_layer_selection_changed(self) -> None:
-        current_layer = self._layers.selection.active
+        # One handler per selection change, so the active layer is read
+        # once for both the label and the name-event wiring.
+        current_layer: Layer | None = self._layers.selection.active
+        self._show_inheriting_layer(current_layer)
         if current_layer is self._event_connected_layer:
             return
         if self._event_connected_layer is not None:
@@ -206,10 +267,6 @@ class InheritanceWidget(QWidget):
             self._layers.events.changed.disconnect(
                 self._update_layers_combobox
             )
-        with suppress(TypeError, ValueError):
-            self._layers.selection.events.active.disconnect(
-                self._update_inheriting_label
-            )
         with suppress(TypeError, ValueError):
             self._layers.selection.events.active.disconnect(
                 self._on_layer_selection_changed
@@ -8,7 +8,8 @@ horizontal layouts depending on the dock widget area.
 Orientation switching works by tearing down and rebuilding the content
 page.  The component *instances* (``FileGeneralMetadata``,
 ``AxisMetadata``, ``InheritanceWidget``) persist across rebuilds — only
-the container widgets and grid layouts are recreated.
+the container widgets and grid layouts are recreated.  A layer change
+that keeps the orientation only replaces the axis section's grid.
 """
 
 from __future__ import annotations
@@ -23,7 +24,6 @@ from qtpy.QtWidgets import (
     QFrame,
     QGridLayout,
     QHBoxLayout,
-    QLabel,
     QMainWindow,
     QScrollArea,
     QSizePolicy,
@@ -33,6 +33,7 @@ from qtpy.QtWidgets import (
 )
 
 from napari_metadata._layout_utils import _allocate_section_extents
+from napari_metadata._qt_utils import _bold_label
 from napari_metadata.widgets._axis import AxisMetadata
 from napari_metadata.widgets._base import AxisComponentBase
 from napari_metadata.widgets._containers import (
@@ -44,6 +45,8 @@ from napari_metadata.widgets._file import FileGeneralMetadata
 from napari_metadata.widgets._inheritance import InheritanceWidget
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from napari.components import ViewerModel
     from napari.layers import Layer
 
@@ -54,6 +57,11 @@ _NO_LAYER_PAGE = 1
 #: Used both in the sections QLayout and in the manual size allocator.
 _SECTIONS_SPACING = 3
 
+#: Axis grid separators: line thickness and padding (px) on each side.
+_SEPARATOR_THICKNESS = 3
+_SEPARATOR_PADDING = 2
+_SEPARATOR_STYLE = 'color: #999; background-color: #999;'
+
 
 class MetadataWidget(QWidget):
     """Top-level dock widget for viewing and editing layer metadata.
@@ -64,9 +72,11 @@ class MetadataWidget(QWidget):
       and a *no-layer placeholder* (index 1).
     * The content page contains a single orientation-appropriate
       ``QScrollArea`` with three ``CollapsibleSectionContainer`` children.
-    * On orientation or layer change the content page is torn down and
-      rebuilt via ``_rebuild_content``.  Component **instances** persist;
-      only the container widgets and grid layouts are recreated.
+    * On orientation change the content page is torn down and rebuilt
+      via ``_rebuild_content``.  Component **instances** persist; only
+      the container widgets and grid layouts are recreated.  A layer
+      change with the same orientation keeps the page and swaps in a new
+      axis grid.
     """
 
     def __init__(self, napari_viewer: ViewerModel) -> None:
@@ -77,6 +87,12 @@ class MetadataWidget(QWidget):
         self._layers = napari_viewer.layers
         self._selected_layer: Layer | None = None
         self._current_orientation: Orientation | None = None
+        # Orientation the dock placement requires, cached between dock
+        # signals so selection changes do not query the main window.
+        self._required_orientation: Orientation | None = None
+        # Set when the dock moved while this widget was hidden; the page
+        # is brought in line with the new orientation once shown again.
+        self._orientation_stale: bool = False
         self._widget_parent: QObject | None = self.parent()
         self._already_shown: bool = False
         self._rebuilding: bool = False
@@ -88,13 +104,12 @@ class MetadataWidget(QWidget):
         self._inheritance_section_expanded: bool = False
 
         # ── Persistent component instances ──────────────────────────
-        self._general_metadata_instance = FileGeneralMetadata(self)
-        self._axis_metadata_instance = AxisMetadata(self)
-        self._inheritance_instance = InheritanceWidget(
-            self._layers,
-            on_apply_inheritance=self.apply_inheritance_to_current_layer,
-            parent=self,
-        )
+        # Created by ``_build_components`` on first show (or earlier, when
+        # first used), not while the widget is merely constructed.
+        self._components_built: bool = False
+        self._general_metadata: FileGeneralMetadata | None = None
+        self._axis_metadata: AxisMetadata | None = None
+        self._inheritance: InheritanceWidget | None = None
 
         # ── Stacked layout (content + no-layer) ────────────────────
         self._stacked_layout = QStackedLayout()
@@ -114,9 +129,8 @@ class MetadataWidget(QWidget):
         no_layer_page = QWidget(self)
         no_layer_layout = QVBoxLayout(no_layer_page)
         no_layer_layout.setContentsMargins(0, 0, 0, 0)
-        no_layer_label = QLabel('Select a layer to display its metadata')
+        no_layer_label = _bold_label('Select a layer to display its metadata')
         no_layer_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        no_layer_label.setStyleSheet('font-weight: bold;')
         no_layer_layout.addWidget(no_layer_label)
         no_layer_layout.addStretch(1)
         self._stacked_layout.addWidget(no_layer_page)  # index 1
@@ -126,31 +140,85 @@ class MetadataWidget(QWidget):
         self._file_section: CollapsibleSectionContainer | None = None
         self._axis_section: CollapsibleSectionContainer | None = None
         self._inheritance_section: CollapsibleSectionContainer | None = None
+        # Orientation and axis widget generations the axis grid was last
+        # populated with; an equal key means the grid still holds the
+        # current widgets.
+        self._axis_grid_key: tuple[Orientation, tuple[int, ...]] | None = None
 
         # Start on the no-layer page — no layer is selected at construction
         self._stacked_layout.setCurrentIndex(_NO_LAYER_PAGE)
 
+    # ------------------------------------------------------------------
+    # Persistent components
+    # ------------------------------------------------------------------
+
+    def _build_components(self) -> None:
+        """Create the persistent component instances once."""
+        if self._components_built:
+            return
+        self._general_metadata = FileGeneralMetadata(self)
+        self._axis_metadata = AxisMetadata(self)
+        self._inheritance = InheritanceWidget(
+            self._layers,
+            on_apply_inheritance=self.apply_inheritance_to_current_layer,
+            parent=self,
+        )
+        self._components_built = True
+
+    @property
+    def _general_metadata_instance(self) -> FileGeneralMetadata:
+        self._build_components()
+        assert self._general_metadata is not None
+        return self._general_metadata
+
+    @property
+    def _axis_metadata_instance(self) -> AxisMetadata:
+        self._build_components()
+        assert self._axis_metadata is not None
+        return self._axis_metadata
+
+    @property
+    def _inheritance_instance(self) -> InheritanceWidget:
+        self._build_components()
+        assert self._inheritance is not None
+        return self._inheritance
+
     # ------------------------------------------------------------------
     # Event handling
     # ------------------------------------------------------------------
 
     def showEvent(self, a0: QShowEvent | None) -> None:
         if self._already_shown:
+            if self._orientation_stale:
+                self._orientation_stale = False
+                orientation = self._required_orientation
+                if orientation is None:
+                    orientation = self._get_required_orientation()
+                    self._required_orientation = orientation
+                self._apply_required_orientation(orientation)
             return
 
         super().showEvent(a0)
+        self._build_components()
 
         parent_widget = self.parent()
         if parent_widget is None or not isinstance(parent_widget, QDockWidget):
             return
 
         self._widget_parent = parent_widget
+        self._required_orientation = None
         self._layers.selection.events.active.connect(
             self._on_selected_layers_changed
         )
+        self._layers.events.removed.connect(self._on_layer_removed)
         self._widget_parent.dockLocationChanged.connect(
             self._on_dock_location_changed
         )
+        # Floating changes the orientation too, but rebuilding mid-drag is
+        # not wanted; the next page refresh picks it up.
+        self._widget_parent.topLevelChanged.connect(
+            self._invalidate_required_orientation
+        )
         self._on_selected_layers_changed()
         self._already_shown = True
 
@@ -189,29 +257,58 @@ class MetadataWidget(QWidget):
 
     def _on_dock_location_changed(self) -> None:
         """Handle dock widget location change — rebuild if orientation changed."""
+        orientation = self._get_required_orientation()
+        self._required_orientation = orientation
+        if not self.isVisible():
+            # E.g. tabbed behind another dock: nothing would be painted.
+            self._orientation_stale = True
+            return
+        self._apply_required_orientation(orientation)
+
+    def _apply_required_orientation(self, orientation: Orientation) -> None:
+        """Rebuild the page if it was built for another orientation."""
         if self._selected_layer is None:
             return
-        orientation = self._get_required_orientation()
         if orientation != self._current_orientation:
             self._rebuild_content(orientation)
 
+    def _invalidate_required_orientation(self) -> None:
+        self._required_orientation = None
+
     def _on_selected_layers_changed(self) -> None:
         """Handle layer selection change — always refresh page."""
         layer: Layer | None = self._layers.selection.active
         if layer is self._selected_layer:
             return
 
-        if self._selected_layer is not None:
-            self._general_metadata_instance.unbind_layer()
-            self._axis_metadata_instance.unbind_layer()
-
         if layer is not None:
+            # Binding replaces any previous layer, and is a no-op for the
+            # layer the components are still bound to.
             self._general_metadata_instance.bind_layer(layer)
             self._axis_metadata_instance.bind_layer(layer)
+        elif not any(lyr is self._selected_layer for lyr in self._layers):
+            self._unbind_components()
+        # Otherwise the deselected layer stays bound, so reselecting it
+        # reuses its widgets instead of tearing them down and rebuilding.
 
         self._selected_layer = layer
         self._refresh_page()
 
+    def _on_layer_removed(self, event) -> None:
+        """Release a layer kept bound while nothing is selected."""
+        if (
+            self._selected_layer is None
+            and self._components_built
+            and event.value is self._axis_metadata_instance._selected_layer
+        ):
+            self._unbind_components()
+
+    def _unbind_components(self) -> None:
+        if not self._components_built:
+            return
+        self._general_metadata_instance.unbind_layer()
+        self._axis_metadata_instance.unbind_layer()
+
     # ------------------------------------------------------------------
     # Orientation detection
     # ------------------------------------------------------------------
@@ -245,7 +342,10 @@ class MetadataWidget(QWidget):
             self._current_orientation = None
             return
 
-        orientation = self._get_required_orientation()
+        orientation = self._required_orientation
+        if orientation is None:
+            orientation = self._get_required_orientation()
+            self._required_orientation = orientation
         self._rebuild_content(orientation)
         self._stacked_layout.setCurrentIndex(_CONTENT_PAGE)
 
@@ -254,12 +354,29 @@ class MetadataWidget(QWidget):
         if self._rebuilding:
             return
         self._rebuilding = True
+        # Hold off repaints until the new page is assembled, so the widgets
+        # being re-added are painted once rather than per insertion.
+        was_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
         try:
             self._do_rebuild_content(orientation)
         finally:
+            self.setUpdatesEnabled(was_enabled)
             self._rebuilding = False
+        # Section toggles replayed during the rebuild skip sizing; allocate
+        # the section extents once the new page is complete.
+        self._update_section_sizes()
 
     def _do_rebuild_content(self, orientation: Orientation) -> None:
+        if (
+            orientation == self._current_orientation
+            and self._axis_section is not None
+        ):
+            # Same orientation: the file and inheritance widgets are shared
+            # by every layer, so only the per-axis grid is replaced.
+            self._replace_axis_content(orientation)
+            return
+
         is_vertical = orientation == 'vertical'
 
         # _teardown_content saves expanded states to instance variables before
@@ -332,15 +449,40 @@ class MetadataWidget(QWidget):
         scroll.setWidget(scroll_content)
         self._content_page_layout.addWidget(scroll)
 
+        # Adding the scroll area invalidates the page layout; activating it
+        # calls updateGeometry() up the parent chain, so no explicit
+        # geometry notifications are needed here.
         self._current_orientation = orientation
-        self._update_section_sizes()
-        self.updateGeometry()
-        parent = self.parentWidget()
-        if parent is not None:
-            parent.updateGeometry()
+
+    def _replace_axis_content(self, orientation: Orientation) -> None:
+        """Swap a freshly populated axis grid into the existing section."""
+        axis_section = self._axis_section
+        assert axis_section is not None
+        if self._axis_grid_key == self._get_axis_grid_key(orientation):
+            return
+        self._detach_axis_widgets()
+        container = QWidget(self)
+        grid = QGridLayout(container)
+        self._populate_axis_grid(grid, orientation)
+        axis_section.set_content_widget(container)
+        self._axis_metadata_instance.set_checkboxes_visible(
+            self._inheritance_section_visible()
+        )
+
+    def _get_axis_grid_key(
+        self, orientation: Orientation
+    ) -> tuple[Orientation, tuple[int, ...]]:
+        return orientation, tuple(
+            c.widget_generation
+            for c in self._axis_metadata_instance.iter_components()
+        )
+
+    def _inheritance_section_visible(self) -> bool:
+        section = self._inheritance_section
+        return section is not None and section.isExpanded()
 
     def _update_section_sizes(self) -> None:
-        if self._current_orientation is None:
+        if self._current_orientation is None or self._rebuilding:
             return
         self._update_section_extents(self._current_orientation)
 
@@ -421,6 +563,10 @@ class MetadataWidget(QWidget):
         )
 
     def _teardown_content(self) -> None:
+        if self._scroll_area is None:
+            # Nothing is built, and the component widgets (if created yet)
+            # already sit directly under this widget.
+            return
         # Save expanded states before nullifying sections so they survive the
         # transition through a no-layer page (e.g. during layer add/remove).
         if self._file_section is not None:
@@ -433,6 +579,7 @@ class MetadataWidget(QWidget):
             )
         self._detach_component_widgets()
         self._remove_scroll_area()
+        self._axis_grid_key = None
         self._file_section = None
         self._axis_section = None
         self._inheritance_section = None
@@ -453,22 +600,24 @@ class MetadataWidget(QWidget):
         This ensures they are not destroyed when old containers are deleted
         via ``deleteLater()``.
         """
-        for comp in self._general_metadata_instance.components:
+        for comp in self._general_metadata_instance.iter_components():
             comp.component_label.setParent(self)
             with QSignalBlocker(comp.value_widget):
                 comp.value_widget.setParent(self)
 
-        for comp in self._axis_metadata_instance.components:
-            comp.component_label.setParent(self)
-            for i in range(comp.num_axes):
-                for entry in comp.get_layout_entries(i):
-                    for w in entry.widgets:
-                        with QSignalBlocker(w):
-                            w.setParent(self)
+        self._detach_axis_widgets()
 
         with QSignalBlocker(self._inheritance_instance):
             self._inheritance_instance.setParent(self)
 
+    def _detach_axis_widgets(self) -> None:
+        """Reparent the axis component widgets back to *self*."""
+        for comp in self._axis_metadata_instance.iter_components():
+            comp.component_label.setParent(self)
+            for w in comp.iter_widgets():
+                with QSignalBlocker(w):
+                    w.setParent(self)
+
     def _on_inheritance_toggled(self, checked: bool) -> None:
         """Handle inheritance section toggle — sync checkboxes and sizes."""
         self._axis_metadata_instance.set_checkboxes_visible(checked)
@@ -524,10 +673,9 @@ class MetadataWidget(QWidget):
             orientation=orientation,
             on_toggle=self._on_inheritance_toggled,
         )
-        container = QWidget(self)
-        layout = QGridLayout(container)
-        layout.addWidget(self._inheritance_instance)
-        section.set_content_widget(container)
+        # The widget lays out its own rows, so it is the content directly
+        # rather than sitting alone in a wrapper grid.
+        section.set_content_widget(self._inheritance_instance)
         return section
 
     # ------------------------------------------------------------------
@@ -541,13 +689,18 @@ class MetadataWidget(QWidget):
         is_vertical = orientation == 'vertical'
         row = 0
         layer = self._selected_layer
+        general = self._general_metadata_instance
 
-        for component in self._general_metadata_instance.components:
-            if layer is not None:
-                component.load_entries(layer)
-            else:
+        # Binding is a no-op when the coordinator already holds *layer*
+        # (the usual case after ``_on_selected_layers_changed``), so the
+        # layer metadata is only read once per selection change.
+        if layer is not None:
+            general.bind_layer(layer)
+        else:
+            for component in general.iter_components():
                 component.clear()
 
+        for component in general.iter_components():
             if is_vertical and component._under_label_in_vertical:
                 grid.addWidget(component.component_label, row, 0, 1, 1)
                 row += 1
@@ -571,19 +724,14 @@ class MetadataWidget(QWidget):
                 )
             row += 1
 
-        # Stretch settings
+        # Stretch settings.  Grids are built fresh for every page, so all
+        # stretches start at 0 and only the non-zero ones are set.
         if is_vertical:
-            for r in range(grid.rowCount()):
-                grid.setRowStretch(r, 0)
             grid.setRowStretch(grid.rowCount(), 1)
-            for c in range(grid.columnCount()):
-                grid.setColumnStretch(c, 0)
             grid.setColumnStretch(max(grid.columnCount() - 1, 0), 1)
         else:
             for r in range(grid.rowCount()):
                 grid.setRowStretch(r, 1)
-            for c in range(grid.columnCount()):
-                grid.setColumnStretch(c, 0)
             grid.setColumnStretch(grid.columnCount(), 1)
 
     # ------------------------------------------------------------------
@@ -595,14 +743,17 @@ class MetadataWidget(QWidget):
     ) -> None:
         """Dispatch to orientation-specific axis grid builder."""
         layer = self._selected_layer
-        components = self._axis_metadata_instance.components
+        axis_metadata = self._axis_metadata_instance
         if layer is not None:
+            axis_metadata.bind_layer(layer)
+            components = axis_metadata.iter_components()
             if orientation == 'vertical':
-                _populate_axis_grid_vertical(grid, components, layer)
+                _populate_axis_grid_vertical(grid, components)
             else:
-                _populate_axis_grid_horizontal(grid, components, layer)
+                _populate_axis_grid_horizontal(grid, components)
+            self._axis_grid_key = self._get_axis_grid_key(orientation)
         else:
-            for c in components:
+            for c in axis_metadata.iter_components():
                 c.clear()
 
     # ------------------------------------------------------------------
@@ -623,11 +774,11 @@ class MetadataWidget(QWidget):
             )
             return
 
-        for component in self._axis_metadata_instance.components:
-            component.inherit_layer_properties(template_layer, active_layer)
-
-        # Rebuild to show inherited values
-        self._refresh_page()
+        # Bound layer events refresh the axis widgets in place, and the row
+        # layout cannot change with ndim fixed, so no page rebuild.
+        self._axis_metadata_instance.inherit_layer_properties(
+            template_layer, active_layer
+        )
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -646,8 +797,7 @@ class MetadataWidget(QWidget):
 
 def _populate_axis_grid_vertical(
     grid: QGridLayout,
-    components: list[AxisComponentBase],
-    layer: Layer,
+    components: Iterable[AxisComponentBase],
 ) -> None:
     """Layout axis components stacked vertically (side dock position).
 
@@ -659,66 +809,40 @@ def _populate_axis_grid_vertical(
         Label:  | ...
     """
     grid.setVerticalSpacing(8)
+    add_widget = grid.addWidget
     row = 0
     max_cols = 0
     separator_rows: list[int] = []
 
     for idx, component in enumerate(components):
-        col = 0
-        grid.addWidget(component.component_label, row, col, 1, 1)
-        col += 1
-        component.load_entries(layer)
+        # Separators go between components, i.e. before all but the first.
+        if idx:
+            separator_rows.append(row)
+            row += 1
+        add_widget(component.component_label, row, 0, 1, 1)
+        flat_layout_row = component.flat_layout_row
 
         for axis_index in range(component.num_axes):
-            setting_col = col
-            max_row_span = 0
-            col_span_sum = 0
-
-            for entry in component.get_layout_entries(axis_index):
-                for widget in entry.widgets:
-                    grid.addWidget(
-                        widget,
-                        row,
-                        setting_col,
-                        entry.row_span,
-                        entry.col_span,
-                    )
-                setting_col += entry.col_span
-                col_span_sum += entry.col_span
-                max_row_span = max(max_row_span, entry.row_span)
-
-            max_cols = max(max_cols, col_span_sum)
-            row += max_row_span
-
-        if idx < len(components) - 1:
-            separator_rows.append(row)
-            row += 3
+            flat = flat_layout_row(axis_index)
+            for widget, col_offset, row_span, col_span in flat.cells:
+                add_widget(widget, row, 1 + col_offset, row_span, col_span)
+            if flat.col_span > max_cols:
+                max_cols = flat.col_span
+            row += flat.row_span
 
     # Separators
     total_cols = max_cols + 1
     for sep_row in separator_rows:
         _add_horizontal_separator(grid, sep_row, total_cols)
 
-    # Stretch settings
-    for r in range(grid.rowCount()):
-        if r > row + 1:
-            grid.setRowMinimumHeight(r, 0)
-        grid.setRowStretch(r, 0)
+    # Stretch settings (the grid is fresh, so every other stretch is 0)
     grid.setRowStretch(row + 1, 1)
-    for c in range(grid.columnCount()):
-        if c > max_cols:
-            grid.setColumnMinimumWidth(c, 0)
-        grid.setColumnStretch(c, 0)
     grid.setColumnStretch(max_cols, 1)
-    parent = grid.parentWidget()
-    if parent is not None:
-        parent.updateGeometry()
 
 
 def _populate_axis_grid_horizontal(
     grid: QGridLayout,
-    components: list[AxisComponentBase],
-    layer: Layer,
+    components: Iterable[AxisComponentBase],
 ) -> None:
     """Layout axis components side by side (top/bottom dock position).
 
@@ -728,113 +852,87 @@ def _populate_axis_grid_horizontal(
         | ax0 val cb  |     | ax0 val cb  |
         | ax1 val cb  |     | ax1 val cb  |
     """
+    add_widget = grid.addWidget
     starting_col = 0
     max_rows = 0
     separator_cols: list[int] = []
 
     for idx, component in enumerate(components):
-        current_col = starting_col
+        if idx:
+            # Column left free after the previous component's group.
+            separator_cols.append(starting_col - 1)
         current_row = 1  # row 0 reserved for the component label
-        component.load_entries(layer)
+        flat_layout_row = component.flat_layout_row
 
         max_axis_col_span = 0
         for axis_index in range(component.num_axes):
-            setting_col = current_col
-            max_row_span = 0
-            col_sum = 0
-
-            for entry in component.get_layout_entries(axis_index):
-                for widget in entry.widgets:
-                    grid.addWidget(
-                        widget,
-                        current_row,
-                        setting_col,
-                        entry.row_span,
-                        entry.col_span,
-                    )
-                setting_col += entry.col_span
-                col_sum += entry.col_span
-                max_row_span = max(max_row_span, entry.row_span)
-
-            max_axis_col_span = max(max_axis_col_span, col_sum)
-            current_row += max_row_span
-
-        max_rows = max(max_rows, current_row)
+            flat = flat_layout_row(axis_index)
+            for widget, col_offset, row_span, col_span in flat.cells:
+                add_widget(
+                    widget,
+                    current_row,
+                    starting_col + col_offset,
+                    row_span,
+                    col_span,
+                )
+            if flat.col_span > max_axis_col_span:
+                max_axis_col_span = flat.col_span
+            current_row += flat.row_span
 
-        component.component_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        grid.addWidget(component.component_label, 0, starting_col, 1, 1)
+        if current_row > max_rows:
+            max_rows = current_row
 
-        if idx < len(components) - 1:
-            separator_cols.append(starting_col + max_axis_col_span)
+        component.component_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        add_widget(component.component_label, 0, starting_col, 1, 1)
 
-        starting_col += max_axis_col_span + 3
+        starting_col += max_axis_col_span + 1
 
     # Separators
     total_rows = max_rows + 1
     for sep_col in separator_cols:
         _add_vertical_separator(grid, sep_col, total_rows)
 
-    # Stretch settings
-    for r in range(grid.rowCount()):
-        if r > max_rows + 1:
-            grid.setRowMinimumHeight(r, 0)
-        grid.setRowStretch(r, 0)
+    # Stretch settings (the grid is fresh, so every other stretch is 0)
     grid.setRowStretch(max_rows + 1, 1)
-    for c in range(grid.columnCount()):
-        if c > starting_col - 2:
-            grid.setColumnMinimumWidth(c, 0)
-        grid.setColumnStretch(c, 0)
-    grid.setColumnStretch(starting_col - 2, 1)
-    parent = grid.parentWidget()
-    if parent is not None:
-        parent.updateGeometry()
+    grid.setColumnStretch(starting_col, 1)
 
 
 def _add_horizontal_separator(
     grid: QGridLayout, row: int, col_span: int
 ) -> None:
-    """Insert a horizontal separator (padding-line-padding) at *row*."""
-    before = QWidget()
-    before.setFixedHeight(2)
-    before.setSizePolicy(
-        QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed
-    )
-    grid.addWidget(before, row, 0, 1, col_span)
+    """Insert a horizontal separator line at *row*.
 
+    A single ``QFrame`` whose stylesheet margins stand in for the padding
+    on either side, including the grid spacing a padding row would add.
+    """
+    pad = _SEPARATOR_PADDING + max(grid.verticalSpacing(), 0)
     line = QFrame()
     line.setFrameShape(QFrame.Shape.HLine)
     line.setFrameShadow(QFrame.Shadow.Sunken)
-    line.setStyleSheet('color: #999; background-color: #999;')
-    line.setFixedHeight(3)
+    line.setStyleSheet(
+        f'QFrame {{ margin-top: {pad}px; margin-bottom: {pad}px; '
+        f'{_SEPARATOR_STYLE} }}'
+    )
+    line.setFixedHeight(_SEPARATOR_THICKNESS + 2 * pad)
     line.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-    grid.addWidget(line, row + 1, 0, 1, col_span)
-
-    after = QWidget()
-    after.setFixedHeight(2)
-    after.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-    grid.addWidget(after, row + 2, 0, 1, col_span)
+    grid.addWidget(line, row, 0, 1, col_span)
 
 
 def _add_vertical_separator(
     grid: QGridLayout, col: int, row_span: int
 ) -> None:
-    """Insert a vertical separator (padding-line-padding) at *col*."""
-    before = QWidget()
-    before.setFixedWidth(2)
-    before.setSizePolicy(
-        QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding
-    )
-    grid.addWidget(before, 0, col, row_span, 1)
+    """Insert a vertical separator line at *col*.
 
+    Mirrors ``_add_horizontal_separator`` with left/right margins.
+    """
+    pad = _SEPARATOR_PADDING + max(grid.horizontalSpacing(), 0)
     line = QFrame()
     line.setFrameShape(QFrame.Shape.VLine)
     line.setFrameShadow(QFrame.Shadow.Sunken)
-    line.setStyleSheet('color: #999; background-color: #999;')
-    line.setFixedWidth(3)
+    line.setStyleSheet(
+        f'QFrame {{ margin-left: {pad}px; margin-right: {pad}px; '
+        f'{_SEPARATOR_STYLE} }}'
+    )
+    line.setFixedWidth(_SEPARATOR_THICKNESS + 2 * pad)
     line.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-    grid.addWidget(line, 0, col + 1, row_span, 1)
-
-    after = QWidget()
-    after.setFixedWidth(2)
-    after.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Expanding)
-    grid.addWidget(after, 0, col + 2, row_span, 1)
+    grid.addWidget(line, 0, col, row_span, 1)
@@ -1,7 +1,37 @@
+from collections.abc import Callable
+
 import numpy as np
 import pytest
+from qtpy.QtCore import QEvent, QObject
+from qtpy.QtWidgets import QWidget
 
 
 @pytest.fixture
 def rng() -> np.random.Generator:
     return np.random.default_rng(0)
+
+
+class _ToolTipChangeCounter(QObject):
+    """Event filter counting ``ToolTipChange`` events on a widget."""
+
+    count = 0
+
+    def eventFilter(self, a0, a1):
+        if a1.type() == QEvent.Type.ToolTipChange:
+            self.count += 1
+        return False
+
+
+@pytest.fixture
+def tooltip_change_counter() -> Callable[[QWidget], _ToolTipChangeCounter]:
+    """Return a function that starts counting tooltip changes on a widget."""
+    counters: list[_ToolTipChangeCounter] = []
+
+    def install(widget: QWidget) -> _ToolTipChangeCounter:
+        counter = _ToolTipChangeCounter()
+        widget.installEventFilter(counter)
+        # Keep the filter alive for the duration of the test.
+        counters.append(counter)
+        return counter
+
+    return install
@@ -130,6 +130,35 @@ class TestGenerateDisplaySize:
         assert result == _generate_text_for_size(expected_size)
         assert '(in memory)' not in result
 
+    def test_from_disk_directory_measured_once_per_layer(
+        self, tmp_path, monkeypatch
+    ):
+        from pathlib import Path
+
+        dir_path = tmp_path / 'test_dir'
+        dir_path.mkdir()
+        np.save(dir_path / 'a.npy', np.zeros((10, 10), dtype=np.uint8))
+        layer = MagicMock(spec=napari.layers.Image)
+        layer.source.path = str(dir_path)
+        first = generate_display_size(layer)
+
+        walks = []
+        original = Path.rglob
+        monkeypatch.setattr(
+            Path,
+            'rglob',
+            lambda self, pattern: (
+                walks.append(self) or original(self, pattern)
+            ),
+        )
+        assert generate_display_size(layer) == first
+        assert walks == []
+
+        other = MagicMock(spec=napari.layers.Image)
+        other.source.path = str(dir_path)
+        assert generate_display_size(other) == first
+        assert len(walks) == 1
+
     def test_in_memory_suffix_present(self):
         # data is not on disk, so in memory will be appended
         data = np.zeros((4, 4), dtype=np.uint8)
@@ -0,0 +1,35 @@
+from qtpy.QtWidgets import QWidget
+
+from napari_metadata._qt_utils import _apply_tooltip, _bold_label
+
+
+class TestBoldLabel:
+    def test_bold_label_shares_stylesheet(self, qtbot):
+        parent = QWidget()
+        qtbot.addWidget(parent)
+
+        plain = _bold_label('a', parent)
+        other = _bold_label('b')
+
+        assert plain.parent() is parent
+        assert 'bold' in plain.styleSheet()
+        assert plain.styleSheet() == other.styleSheet()
+
+    def test_bold_label_with_color(self, qtbot):
+        label = _bold_label('warning', color='red')
+        qtbot.addWidget(label)
+
+        assert label.styleSheet() == 'color: red; font-weight: bold;'
+
+
+class TestApplyTooltip:
+    def test_sets_tooltip_once(self, qtbot, tooltip_change_counter):
+        widget = QWidget()
+        qtbot.addWidget(widget)
+        counter = tooltip_change_counter(widget)
+
+        _apply_tooltip(widget, 'tip')
+        _apply_tooltip(widget, 'tip')
+
+        assert widget.toolTip() == 'tip'
+        assert counter.count == 1
@@ -22,6 +22,13 @@ class TestUnitConfig:
         for name in unit_cfg.units:
             assert name in unit_strs
 
+    def test_configured_strings_are_canonical_pint_names(self):
+        """Formatting each parsed unit gives back the configured string."""
+        for at in AxisUnitEnum:
+            if at.value is not None:
+                unit_strs = [str(u) for u in at.value.pint_units()]
+                assert unit_strs == list(at.value.units)
+
     def test_default_is_in_units(self):
         """The default unit must be one of the configured units."""
         for at in AxisUnitEnum:
@@ -51,6 +51,18 @@ class TestViewerComponentBase:
         assert component.value_widgets[0].toolTip() == 'Viewer tooltip.'
         assert component.get_text_calls == 1
 
+    def test_repeated_load_entries_keeps_tooltip_without_resending(
+        self, viewer_model, parent_widget, tooltip_change_counter
+    ):
+        component = _DummyViewerComponent(viewer_model, parent_widget)
+        component.load_entries()
+        counter = tooltip_change_counter(component.value_widgets[0])
+
+        component.load_entries()
+
+        assert counter.count == 0
+        assert component.value_widgets[0].toolTip() == 'Viewer tooltip.'
+
     def test_default_value_widgets_contains_display_label(
         self, viewer_model, parent_widget
     ):
@@ -10,11 +10,12 @@ from typing import TYPE_CHECKING, Any
 from unittest.mock import patch
 
 import numpy as np
+import pint
 import pytest
 from napari.layers import Image
 from qtpy.QtWidgets import QComboBox
 
-from napari_metadata.units import AxisUnitEnum
+from napari_metadata.units import AxisUnitEnum, _UnitConfig
 from napari_metadata.widgets._axis import (
     AxisLabels,
     AxisMetadata,
@@ -83,6 +84,17 @@ class TestAxisScales:
         assert spinbox.value() == pytest.approx(0.02)
         assert layer.scale[0] == pytest.approx(0.02)
 
+    def test_inherit_merges_checked_axes(self, parent_widget: QWidget):
+        current = _make_layer(scale=(1.0, 2.0))
+        template = _make_layer(scale=(3.0, 4.0))
+        scales = AxisScales(parent_widget)
+        scales.load_entries(current)
+        scales._inherit_checkboxes[0].setChecked(False)
+
+        scales.inherit_layer_properties(template, current)
+
+        assert tuple(current.scale) == pytest.approx((1.0, 4.0))
+
 
 class TestAxisLabels:
     def test_refreshes_when_layer_axis_labels_change(
@@ -141,6 +153,24 @@ class TestAxisTranslations:
         assert translations._spinboxes[0].value() == pytest.approx(10.0)
         assert translations._spinboxes[1].value() == pytest.approx(20.0)
 
+    def test_spinboxes_do_not_track_keyboard(self, parent_widget: QWidget):
+        translations = AxisTranslations(parent_widget)
+        translations.load_entries(_make_layer())
+
+        assert not any(sb.keyboardTracking() for sb in translations._spinboxes)
+
+    def test_cleared_spinbox_is_disconnected(self, parent_widget: QWidget):
+        layer = _make_layer(translate=(0.0, 0.0))
+        translations = AxisTranslations(parent_widget)
+        translations.load_entries(layer)
+        stale = translations._spinboxes[0]
+
+        translations.clear()
+        stale.blockSignals(False)
+        stale.setValue(5.0)
+
+        assert tuple(layer.translate) == pytest.approx((0.0, 0.0))
+
 
 class TestAxisMetadataCoordinator:
     def test_label_changes_propagate_to_sibling_components(
@@ -164,6 +194,34 @@ class TestAxisMetadataCoordinator:
         assert layer.axis_labels[0] == 'test'
         assert scales_component._axis_name_labels[0].text() == 'test'
 
+    def test_rebinding_same_layer_trims_rows_after_ndim_drop(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((4, 3, 2)))
+        axis_metadata = AxisMetadata(parent_widget)
+        axis_metadata.bind_layer(layer)
+        kept = axis_metadata._scales._spinboxes[:2]
+
+        layer.data = np.zeros((4, 3))
+        axis_metadata.bind_layer(layer)
+
+        for component in axis_metadata.iter_components():
+            assert component.num_axes == 2
+        assert axis_metadata._scales._spinboxes == kept
+
+    def test_rebinding_same_layer_adds_rows_after_ndim_rise(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer()
+        axis_metadata = AxisMetadata(parent_widget)
+        axis_metadata.bind_layer(layer)
+
+        layer.data = np.zeros((4, 3, 2))
+        axis_metadata.bind_layer(layer)
+
+        for component in axis_metadata.iter_components():
+            assert component.num_axes == 3
+
     def test_set_checkboxes_visible_updates_all_components(
         self, parent_widget: QWidget
     ):
@@ -191,6 +249,20 @@ class TestAxisMetadataCoordinator:
                 for checkbox in component._inherit_checkboxes
             )
 
+    def test_label_edit_propagates_once(self, parent_widget: QWidget):
+        layer = _make_layer(axis_labels=('y', 'x'))
+        axis_metadata = AxisMetadata(parent_widget)
+        axis_metadata.bind_layer(layer)
+        line_edit = axis_metadata._labels._line_edits[0]
+
+        with patch.object(
+            AxisScales, 'update_axis_name_labels', autospec=True
+        ) as update:
+            line_edit.setText('row')
+            line_edit.editingFinished.emit()
+
+        update.assert_called_once_with(axis_metadata._scales, layer)
+
     def test_components_property_returns_copy(self, parent_widget: QWidget):
         axis_metadata = AxisMetadata(parent_widget)
         components = axis_metadata.components
@@ -273,6 +345,28 @@ class TestAxisUnits:
         assert combobox.currentIndex() == -1
         assert combobox.count() == 0
 
+    def test_unit_label_missing_from_rows_selects_nothing(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('pixel', 'second'))
+        units_component = AxisUnits(parent_widget)
+        units_component.load_entries(layer)
+        combobox = QComboBox(parent=parent_widget)
+
+        with patch(
+            'napari_metadata.widgets._axis._unit_indices', return_value={}
+        ):
+            matched_type = AxisUnits._populate_unit_combobox(
+                'second', combobox
+            )
+            units_component._type_comboboxes[0].setCurrentEnum(
+                AxisUnitEnum.TIME
+            )
+
+        assert matched_type == AxisUnitEnum.TIME
+        assert combobox.currentIndex() == -1
+        assert units_component._unit_comboboxes[0].currentIndex() == -1
+
     def test_refresh_values_updates_known_and_custom_units(
         self, parent_widget: QWidget
     ):
@@ -295,6 +389,24 @@ class TestAxisUnits:
         )
         assert units_component._unit_comboboxes[1].currentText() == 'hour'
 
+    def test_refresh_keeps_unit_model_when_unit_type_is_unchanged(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('pixel', 'second'))
+        units_component = AxisUnits(parent_widget)
+        units_component.load_entries(layer)
+        space_model = units_component._unit_comboboxes[0].model()
+        time_model = units_component._unit_comboboxes[1].model()
+
+        layer.units = ('micrometer', 'second')
+        units_component.load_entries(layer)
+
+        assert units_component._unit_comboboxes[0].model() is space_model
+        assert units_component._unit_comboboxes[1].model() is time_model
+        assert units_component._unit_comboboxes[0].currentText() == (
+            'micrometer'
+        )
+
     def test_custom_none_text_resets_layer_unit_to_pixel(
         self, parent_widget: QWidget
     ):
@@ -321,6 +433,95 @@ class TestAxisUnits:
         assert str(layer.units[0]) == AxisUnitEnum.SPACE.value.default
         assert units_component._unit_comboboxes[0].currentText() == 'pixel'
 
+    def test_unit_combobox_items_carry_pint_units(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('micrometer', 'second'))
+        units_component = AxisUnits(parent_widget)
+        units_component.load_entries(layer)
+
+        unit_cb = units_component._unit_comboboxes[0]
+
+        assert unit_cb.count() == len(AxisUnitEnum.SPACE.value.units)
+        assert unit_cb.currentText() == 'micrometer'
+        assert unit_cb.currentData() == layer.units[0]
+
+    def test_type_change_reuses_parsed_unit_lists(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('micrometer', 'second'))
+        units_component = AxisUnits(parent_widget)
+        units_component.load_entries(layer)
+
+        with patch.object(
+            _UnitConfig,
+            'pint_units',
+            side_effect=AssertionError('re-parsed'),
+        ):
+            units_component._type_comboboxes[0].setCurrentEnum(
+                AxisUnitEnum.TIME
+            )
+
+        unit_cb = units_component._unit_comboboxes[0]
+        assert unit_cb.count() == len(AxisUnitEnum.TIME.value.units)
+        assert isinstance(unit_cb.currentData(), pint.Unit)
+
+    def test_type_change_writes_units_once(self, parent_widget: QWidget):
+        layer = _make_layer(units=('micrometer', 'second'))
+        axis_metadata = AxisMetadata(parent_widget)
+        axis_metadata.bind_layer(layer)
+        units_component = axis_metadata._units
+
+        with patch.object(
+            AxisUnits,
+            '_write_units_to_layer',
+            autospec=True,
+            side_effect=AxisUnits._write_units_to_layer,
+        ) as write:
+            units_component._type_comboboxes[0].setCurrentEnum(
+                AxisUnitEnum.TIME
+            )
+
+        assert write.call_count == 1
+        assert str(layer.units[0]) == AxisUnitEnum.TIME.value.default
+
+    def test_unit_selection_does_not_scan_combobox(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('micrometer', 'second'))
+        units_component = AxisUnits(parent_widget)
+
+        with patch.object(
+            QComboBox, 'findText', side_effect=AssertionError('scanned')
+        ):
+            units_component.load_entries(layer)
+            units_component._type_comboboxes[1].setCurrentEnum(
+                AxisUnitEnum.SPACE
+            )
+
+        assert units_component._unit_comboboxes[0].currentText() == (
+            'micrometer'
+        )
+        assert units_component._unit_comboboxes[1].currentText() == (
+            AxisUnitEnum.SPACE.value.default
+        )
+
+    def test_unit_strings_formatted_once_per_unit(
+        self, parent_widget: QWidget
+    ):
+        layer = _make_layer(units=('micrometer', 'second'))
+        units_component = AxisUnits(parent_widget)
+        units_component.load_entries(layer)
+
+        with patch.object(
+            type(layer.units[0]),
+            '__str__',
+            side_effect=AssertionError('re-formatted'),
+        ):
+            units_component.load_entries(layer)
+
+        assert units_component._unit_line_edits[0].text() == 'micrometer'
+
 
 class TestAxisEventDriven:
     """Tests that programmatic layer changes update the axis metadata widgets."""
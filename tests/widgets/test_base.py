@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -282,6 +283,24 @@ class TestAxisComponentBaseLifecycle:
         assert component._selected_layer is layer
         assert component.num_axes == 2
 
+    def test_widgets_created_with_parent_updates_suspended(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        states: list[bool] = []
+        create = component._create_widgets
+
+        def _record(lyr: Layer) -> None:
+            states.append(parent_widget.updatesEnabled())
+            create(lyr)
+
+        with patch.object(component, '_create_widgets', side_effect=_record):
+            component.load_entries(layer)
+
+        assert states == [False]
+        assert parent_widget.updatesEnabled()
+
     def test_load_entries_refreshes_for_same_layer(
         self, parent_widget: QWidget
     ):
@@ -300,6 +319,58 @@ class TestAxisComponentBaseLifecycle:
         assert component._value_line_edits[0].text() == 'row'
         assert component._value_line_edits[1].text() == 'col'
 
+    def test_new_layer_with_same_ndim_reuses_widgets(
+        self, parent_widget: QWidget
+    ):
+        first = Image(np.zeros((4, 3)), axis_labels=('y', 'x'))
+        second = Image(np.zeros((6, 5)), axis_labels=('row', 'col'))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(first)
+        line_edits = list(component._value_line_edits)
+        component._inherit_checkboxes[0].setChecked(False)
+
+        component.load_entries(second)
+
+        assert component._selected_layer is second
+        assert component.create_count == 1
+        assert component._value_line_edits == line_edits
+        assert [le.text() for le in line_edits] == ['row', 'col']
+        assert [lbl.text() for lbl in component._axis_name_labels] == [
+            'row',
+            'col',
+        ]
+        assert all(cb.isChecked() for cb in component._inherit_checkboxes)
+
+    def test_load_entries_trims_rows_when_ndim_shrinks(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((5, 4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+        kept = component._value_line_edits[:2]
+
+        layer.data = np.zeros((4, 3))
+        component.load_entries(layer)
+
+        assert component.create_count == 1
+        assert component.num_axes == 2
+        assert component._value_line_edits == kept
+        assert len(component._inherit_checkboxes) == 2
+
+    def test_load_entries_rebuilds_rows_when_ndim_grows(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+
+        layer.data = np.zeros((5, 4, 3))
+        component.load_entries(layer)
+
+        assert component.create_count == 2
+        assert component.num_axes == 3
+        assert len(component._value_line_edits) == 3
+
     def test_clear_removes_all_widgets(self, parent_widget: QWidget):
         layer = Image(np.zeros((4, 3)))
         component = _DummyAxisComponent(parent_widget)
@@ -312,6 +383,58 @@ class TestAxisComponentBaseLifecycle:
         assert component.num_axes == 0
         assert component._selected_layer is None
 
+    def test_iter_widgets_walks_cached_lists(self, parent_widget: QWidget):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+
+        with patch.object(
+            _DummyAxisComponent,
+            '_all_widget_lists',
+            side_effect=AssertionError('re-collected'),
+        ):
+            widgets = list(component.iter_widgets())
+
+        assert widgets == [
+            *component._axis_name_labels,
+            *component._inherit_checkboxes,
+            *component._value_line_edits,
+        ]
+
+    def test_clear_defers_deletion_to_one_parent(self, parent_widget: QWidget):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+        widgets = [
+            *component._axis_name_labels,
+            *component._value_line_edits,
+            *component._inherit_checkboxes,
+        ]
+
+        component.clear()
+
+        graveyards = {w.parentWidget() for w in widgets}
+        assert len(graveyards) == 1
+        graveyard = graveyards.pop()
+        assert graveyard.parentWidget() is parent_widget
+        assert not graveyard.isVisible()
+
+    def test_widget_lists_collected_once(self, parent_widget: QWidget):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+
+        with patch.object(
+            _DummyAxisComponent,
+            '_all_widget_lists',
+            side_effect=AssertionError('re-collected'),
+        ):
+            component.clear()
+            component.load_entries(layer)
+            component.clear()
+
+        assert component._value_line_edits == []
+
     def test_get_layout_entries_structure_and_tooltips(
         self, parent_widget: QWidget
     ):
@@ -339,6 +462,60 @@ class TestAxisComponentBaseLifecycle:
                 assert widget.toolTip() == 'Axis tooltip.'
             assert entries[2].widgets[0].toolTip() == ''
 
+    def test_iter_layout_entries_is_lazy(self, parent_widget: QWidget):
+        layer = Image(np.zeros((4, 3)))
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(layer)
+
+        entries = component.iter_layout_entries(0)
+
+        assert not isinstance(entries, list)
+        assert [e.widgets for e in entries] == [
+            e.widgets for e in component.get_layout_entries(0)
+        ]
+
+    def test_layout_rows_reused_until_widgets_change(
+        self, parent_widget: QWidget
+    ):
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(Image(np.zeros((4, 3, 2))))
+
+        first = component.get_layout_entries(0)
+        assert component.get_layout_entries(0) == first
+        assert all(
+            a is b
+            for a, b in zip(
+                component.get_layout_entries(0), first, strict=True
+            )
+        )
+
+        component.load_entries(Image(np.zeros((4, 3))))
+        rebuilt = component.get_layout_entries(0)
+        assert rebuilt[0] is not first[0]
+        assert rebuilt[0].widgets[0] is component._axis_name_labels[0]
+
+        component.clear()
+        assert component._layout_rows == {}
+
+    def test_flat_layout_row_resolves_column_offsets_once(
+        self, parent_widget: QWidget
+    ):
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(Image(np.zeros((4, 3))))
+
+        flat = component.flat_layout_row(1)
+
+        assert flat.cells == (
+            (component._axis_name_labels[1], 0, 1, 1),
+            (component._value_line_edits[1], 1, 1, 1),
+            (component._inherit_checkboxes[1], 2, 1, 1),
+        )
+        assert (flat.row_span, flat.col_span) == (1, 3)
+        assert component.flat_layout_row(1) is flat
+
+        component.clear()
+        assert component._flat_layout_rows == {}
+
 
 class TestAxisComponentBaseHelpers:
     def test_update_axis_name_labels_uses_label_or_index_fallback(
@@ -408,6 +585,47 @@ class TestAxisComponentBaseInheritance:
 
         assert tuple(current.translate) == pytest.approx((1.0, 20.0))
 
+    def test_inherit_layer_properties_skips_when_nothing_checked(
+        self, parent_widget: QWidget
+    ):
+        current = Image(np.zeros((4, 3)), translate=(1.0, 2.0))
+        template = Image(np.zeros((4, 3)), translate=(10.0, 20.0))
+
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(current)
+        for cb in component._inherit_checkboxes:
+            cb.setChecked(False)
+
+        with patch.object(
+            _DummyAxisComponent,
+            '_get_layer_values',
+            side_effect=AssertionError('read'),
+        ):
+            component.inherit_layer_properties(template, current)
+
+        assert component.last_applied is None
+        assert tuple(current.translate) == pytest.approx((1.0, 2.0))
+
+    def test_inherit_layer_properties_all_checked_skips_current_read(
+        self, parent_widget: QWidget
+    ):
+        current = Image(np.zeros((4, 3)), translate=(1.0, 2.0))
+        template = Image(np.zeros((4, 3)), translate=(10.0, 20.0))
+
+        component = _DummyAxisComponent(parent_widget)
+        component.load_entries(current)
+
+        with patch.object(
+            _DummyAxisComponent,
+            '_get_layer_values',
+            autospec=True,
+            side_effect=_DummyAxisComponent._get_layer_values,
+        ) as get_values:
+            component.inherit_layer_properties(template, current)
+
+        get_values.assert_called_once_with(component, template)
+        assert tuple(current.translate) == pytest.approx((10.0, 20.0))
+
 
 class _DummyFileComponent(FileComponentBase):
     _label_text = 'Test:'
@@ -107,6 +107,27 @@ class TestCollapsibleSectionContainerToggle:
         w._button.setChecked(False)
         assert calls == [True, False]
 
+    @pytest.mark.parametrize('orientation', ORIENTATIONS)
+    def test_set_expanded_runs_handler_without_signal(
+        self, qtbot, orientation
+    ):
+        calls: list[bool] = []
+        emitted: list[bool] = []
+        w = CollapsibleSectionContainer(
+            None, 'Sec', orientation, on_toggle=calls.append
+        )
+        qtbot.addWidget(w)
+        w._button.toggled.connect(emitted.append)
+
+        w.setExpanded(True)
+        w.setExpanded(True)
+
+        assert w.isExpanded()
+        assert not w._expanding_area.isHidden()
+        assert '\u25bc' in w._button.text()
+        assert calls == [True]
+        assert emitted == []
+
 
 class TestSetContentWidget:
     from qtpy.QtWidgets import QLabel
@@ -135,6 +156,22 @@ class TestSetContentWidget:
         current = w._expanding_area.widget()
         assert current is not None
 
+    def test_horizontal_replace_reuses_wrapper(self, qtbot):
+        from qtpy.QtWidgets import QLabel
+
+        w = CollapsibleSectionContainer(None, 'T', 'horizontal')
+        qtbot.addWidget(w)
+        first = QLabel('first')
+        w.set_content_widget(first)
+        wrapper = w._expanding_area.widget()
+        second = QLabel('second')
+        w.set_content_widget(second)
+
+        assert w._expanding_area.widget() is wrapper
+        assert second.parentWidget() is wrapper
+        assert wrapper.layout().indexOf(second) == 0
+        assert wrapper.layout().indexOf(first) == -1
+
     def test_vertical_content_area_uses_content_size_hint(self, qtbot):
         from qtpy.QtCore import QSize
         from qtpy.QtWidgets import QWidget
@@ -170,6 +207,55 @@ class TestSetContentWidget:
         assert w._expanding_area.sizeHint().width() == expected
         assert w._expanding_area.sizeHint().height() == 0
 
+    def test_content_hints_cached_until_layout_request(self, qtbot):
+        from qtpy.QtCore import QEvent, QSize
+        from qtpy.QtWidgets import QApplication, QWidget
+
+        class _CountingWidget(QWidget):
+            calls = 0
+
+            def sizeHint(self):
+                type(self).calls += 1
+                return QSize(120, 80)
+
+        w = CollapsibleSectionContainer(None, 'T', 'vertical')
+        qtbot.addWidget(w)
+        content = _CountingWidget()
+        w.set_content_widget(content)
+
+        w._expanding_area.sizeHint()
+        before = _CountingWidget.calls
+        w._expanding_area.sizeHint()
+        w._expanding_area.minimumSizeHint()
+        assert _CountingWidget.calls == before
+
+        QApplication.sendEvent(content, QEvent(QEvent.Type.LayoutRequest))
+        before = _CountingWidget.calls
+        w._expanding_area.sizeHint()
+        assert _CountingWidget.calls == before + 1
+
+    def test_cached_hints_follow_frame_changes(self, qtbot):
+        from qtpy.QtCore import QSize
+        from qtpy.QtWidgets import QFrame, QWidget
+
+        class _HintWidget(QWidget):
+            def sizeHint(self):
+                return QSize(120, 80)
+
+        w = CollapsibleSectionContainer(None, 'T', 'vertical')
+        qtbot.addWidget(w)
+        w.set_content_widget(_HintWidget())
+        area = w._expanding_area
+        area.setFrameShape(QFrame.Shape.Box)
+        area.setLineWidth(3)
+        framed = area.sizeHint().height()
+
+        area.setFrameShape(QFrame.Shape.NoFrame)
+
+        assert area.frameWidth() == 0
+        assert area.sizeHint().height() == 80
+        assert framed > 80
+
     @pytest.mark.parametrize('orientation', ORIENTATIONS)
     def test_content_area_falls_back_to_base_hints_without_widget(
         self, qtbot, orientation
@@ -255,6 +341,56 @@ class TestRotatedButton:
         qtbot.addWidget(btn)
         assert btn.minimumSizeHint() == btn.sizeHint()
 
+    def test_paint_reuses_option_with_current_state(self, qtbot):
+        from qtpy.QtWidgets import QStyle
+
+        btn = RotatedButton('Hello')
+        btn.setCheckable(True)
+        qtbot.addWidget(btn)
+        option = btn._style_option
+
+        btn.grab()
+        assert not option.state & QStyle.StateFlag.State_On
+        btn.setChecked(True)
+        btn.grab()
+        assert btn._style_option is option
+        assert option.state & QStyle.StateFlag.State_On
+
+    def test_paint_transform_matches_rotation(self, qtbot):
+        from qtpy.QtCore import QPointF
+        from qtpy.QtGui import QTransform
+
+        btn = RotatedButton('Hello')
+        qtbot.addWidget(btn)
+        btn.resize(30, 90)
+        btn.grab()
+        transform = btn._paint_transform()
+        expected = QTransform().rotate(-90).translate(-90, 0)
+        assert transform.map(QPointF(10, 5)) == expected.map(QPointF(10, 5))
+        assert btn._paint_transform() is transform
+
+        btn.resize(30, 120)
+        btn.grab()
+        assert btn._paint_transform().map(QPointF(0, 0)) == QPointF(0, 120)
+
+    def test_size_hint_cached_until_text_changes(self, qtbot):
+        btn = RotatedButton('Hi')
+        qtbot.addWidget(btn)
+        short = btn.sizeHint()
+        assert btn._cached_size_hint is not None
+        btn.setText('A much longer header title')
+        assert btn._cached_size_hint is None
+        assert btn.sizeHint().height() > short.height()
+
+    def test_size_hint_invalidated_on_font_change(self, qtbot):
+        btn = RotatedButton('Hello')
+        qtbot.addWidget(btn)
+        btn.sizeHint()
+        font = btn.font()
+        font.setPointSize(font.pointSize() * 3)
+        btn.setFont(font)
+        assert btn._cached_size_hint is None
+
 
 class TestHorizontalOnlyOuterScrollArea:
     def test_resize_event_pins_child_height_to_viewport(self, qtbot):
@@ -271,6 +407,35 @@ class TestHorizontalOnlyOuterScrollArea:
 
         assert content.height() == area.viewport().height()
 
+    def test_width_only_resize_keeps_child_height(self, qtbot, monkeypatch):
+        from qtpy.QtWidgets import QWidget
+
+        area = HorizontalOnlyOuterScrollArea()
+        content = QWidget()
+        area.setWidget(content)
+        area.resize(240, 160)
+        qtbot.addWidget(area)
+        area.show()
+        qtbot.waitExposed(area)
+
+        calls = []
+        original = content.setFixedHeight
+        monkeypatch.setattr(
+            content,
+            'setFixedHeight',
+            lambda h: calls.append(h) or original(h),
+        )
+        area.resize(320, 160)
+        assert calls == []
+
+        area.resize(320, 200)
+        assert calls == [area.viewport().height()]
+
+        replacement = QWidget()
+        area.setWidget(replacement)
+        area.resize(330, 200)
+        assert replacement.height() == area.viewport().height()
+
     def test_wheel_event_is_ignored(self, qtbot):
         """Wheel event must be flagged as ignored (propagated to parent)."""
         from qtpy.QtCore import QPoint, QPointF, Qt
@@ -331,6 +496,44 @@ class TestDisableWheelScrollingFilter:
         result = f.eventFilter(target, None)
         assert result is False
 
+    def test_vertical_sections_share_one_filter(self, qtbot, monkeypatch):
+        from qtpy.QtCore import QEvent, QPoint, QPointF
+        from qtpy.QtGui import QWheelEvent
+        from qtpy.QtWidgets import QApplication
+
+        seen = []
+
+        def _record(self, a0, a1):
+            if a1 is not None and a1.type() == QEvent.Type.Wheel:
+                seen.append((self, a0))
+            return False
+
+        monkeypatch.setattr(
+            DisableWheelScrollingFilter, 'eventFilter', _record
+        )
+        sections = [
+            CollapsibleSectionContainer(None, title, 'vertical')
+            for title in ('A', 'B')
+        ]
+        for section in sections:
+            qtbot.addWidget(section)
+            bar = section._expanding_area.horizontalScrollBar()
+            event = QWheelEvent(
+                QPointF(0, 0),
+                QPointF(0, 0),
+                QPoint(0, 0),
+                QPoint(0, 120),
+                Qt.MouseButton.NoButton,
+                Qt.KeyboardModifier.NoModifier,
+                Qt.ScrollPhase.NoScrollPhase,
+                False,
+            )
+            QApplication.sendEvent(bar, event)
+
+        assert len(seen) == 2
+        assert seen[0][0] is seen[1][0]
+        assert seen[0][1] is not seen[1][1]
+
 
 def test_orientation_literal_values():
     """Orientation is a public name that external code can import."""
@@ -43,6 +43,19 @@ class TestLayerShape:
 
         assert component.value_widget.text() == '(10, 20)'
 
+    def test_reload_does_not_resend_tooltip(
+        self, parent_widget: QWidget, tooltip_change_counter
+    ):
+        layer = Image(np.zeros((10, 20)))
+        component = LayerShape(parent_widget)
+        component.load_entries(layer)
+        counter = tooltip_change_counter(component.value_widget)
+
+        component.load_entries(layer)
+
+        assert counter.count == 0
+        assert component.value_widget.toolTip() == component._tooltip_text
+
 
 class TestLayerDataType:
     def test_displays_dtype_for_image_layer(self, parent_widget: QWidget):
@@ -100,6 +113,65 @@ class TestLayerName:
 
         assert layer.name == 'keep'
 
+    def test_unedited_focus_out_skips_layer(
+        self, parent_widget: QWidget, monkeypatch
+    ):
+        layer = Image(np.zeros((4, 3)), name='keep')
+        component = LayerName(parent_widget)
+        component.bind_layer(layer)
+        calls = []
+        monkeypatch.setattr(
+            component,
+            '_require_selected_layer',
+            lambda: calls.append(1) or layer,
+        )
+
+        component._line_edit.editingFinished.emit()
+
+        assert calls == []
+        assert layer.name == 'keep'
+
+    def test_external_rename_refreshes_skip_text(self, parent_widget: QWidget):
+        layer = Image(np.zeros((4, 3)), name='original')
+        component = LayerName(parent_widget)
+        component.bind_layer(layer)
+
+        component.load_entries(layer)
+        layer.name = 'external'
+        component.load_entries(layer)
+        component._line_edit.setText('original')
+        component._line_edit.editingFinished.emit()
+
+        assert layer.name == 'original'
+
+    def test_external_rename_does_not_emit_text_edits(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((4, 3)), name='original')
+        component = LayerName(parent_widget)
+        component.bind_layer(layer)
+        emitted = []
+        component._line_edit.textChanged.connect(emitted.append)
+
+        layer.name = 'external'
+        component.load_entries(layer)
+
+        assert component._line_edit.text() == 'external'
+        assert emitted == []
+
+    def test_reload_same_name_keeps_line_edit_state(
+        self, parent_widget: QWidget
+    ):
+        layer = Image(np.zeros((4, 3)), name='keep')
+        component = LayerName(parent_widget)
+        component.load_entries(layer)
+        component._line_edit.setCursorPosition(1)
+
+        component.load_entries(layer)
+
+        assert component._line_edit.cursorPosition() == 1
+        assert component._line_edit.text() == 'keep'
+
     def test_clear_clears_text(self, parent_widget: QWidget):
         layer = Image(np.zeros((4, 3)), name='test')
         component = LayerName(parent_widget)
@@ -294,6 +366,12 @@ class TestFileGeneralMetadata:
 
         assert len(meta.components) == 9
 
+    def test_iter_components_matches_components(self, parent_widget: QWidget):
+        meta = FileGeneralMetadata(parent_widget)
+
+        assert list(meta.iter_components()) == meta.components
+        assert isinstance(meta._components, tuple)
+
     def test_all_components_load_entries(self, parent_widget: QWidget):
         layer = Image(np.zeros((4, 3), dtype=np.uint8), name='test')
         meta = FileGeneralMetadata(parent_widget)
@@ -354,6 +432,24 @@ class TestFileEventDriven:
 
         assert file_meta._layer_name.value_widget.text() == 'renamed'
 
+    def test_name_event_reloads_only_layer_name(
+        self, parent_widget: QWidget, monkeypatch
+    ):
+        layer = Image(np.zeros((4, 3)), name='original')
+        file_meta = FileGeneralMetadata(parent_widget)
+        file_meta.bind_layer(layer)
+        reloaded = []
+        for component in file_meta.components:
+            monkeypatch.setattr(
+                component,
+                'load_entries',
+                lambda _layer, component=component: reloaded.append(component),
+            )
+
+        layer.name = 'renamed'
+
+        assert reloaded == [file_meta._layer_name]
+
     def test_data_event_updates_shape_widget(self, parent_widget: QWidget):
         layer = Image(np.zeros((4, 3), dtype=np.uint8), name='test')
         file_meta = FileGeneralMetadata(parent_widget)
@@ -97,6 +97,164 @@ class TestComboboxPopulation:
         assert 'renamed' in items
         assert 'original' not in items
 
+    def test_combobox_rows_carry_layers(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        layers = [
+            viewer_model.add_image(np.zeros((4, 4)), name=name)
+            for name in ('a', 'b', 'c')
+        ]
+        combobox = inheritance_widget._template_combobox
+
+        assert [combobox.itemText(i) for i in range(combobox.count())] == [
+            'None',
+            'a',
+            'b',
+            'c',
+        ]
+        assert combobox.itemData(0) is None
+        for row, layer in enumerate(layers, start=1):
+            assert combobox.itemData(row) is layer
+        assert inheritance_widget._combobox_rows == {
+            id(None): 0,
+            **{id(layer): row for row, layer in enumerate(layers, start=1)},
+        }
+
+    def test_rebuild_restores_combobox_updates(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        combobox = inheritance_widget._template_combobox
+        assert combobox.updatesEnabled()
+
+        viewer_model.add_image(np.zeros((4, 4)), name='a')
+
+        assert combobox.count() == 2
+        assert combobox.updatesEnabled()
+
+    def test_unchanged_layer_list_skips_rebuild(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        viewer_model.add_image(np.zeros((4, 4)), name='a')
+        viewer_model.add_image(np.zeros((4, 4)), name='b')
+        combobox = inheritance_widget._template_combobox
+        model = combobox.model()
+
+        inheritance_widget._update_layers_combobox()
+        assert combobox.model() is model
+
+        # Only the active layer's renames are observed directly.
+        viewer_model.layers[0].name = 'renamed'
+        inheritance_widget._update_layers_combobox()
+        assert combobox.model() is not model
+        assert combobox.itemText(1) == 'renamed'
+
+    def test_unchanged_active_layer_skips_label_text_refresh(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+        monkeypatch,
+    ) -> None:
+        layer = viewer_model.add_image(np.zeros((4, 4)), name='a')
+        viewer_model.layers.selection.active = layer
+        label = inheritance_widget._inheriting_layer_name
+        texts: list[str] = []
+        set_text = label.setText
+        monkeypatch.setattr(
+            label, 'setText', lambda text: texts.append(text) or set_text(text)
+        )
+        compares: list[int] = []
+        monkeypatch.setattr(
+            inheritance_widget,
+            '_compare_template_and_inheriting_layers',
+            lambda: compares.append(1),
+        )
+
+        inheritance_widget._update_inheriting_label()
+        assert texts == []
+        assert compares == [1]
+
+        layer.name = 'b'
+        assert label.text() == 'b'
+        assert texts == ['b']
+        assert compares == [1, 1]
+
+    def test_ndim_change_without_rename_updates_apply_state(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ) -> None:
+        widget = InheritanceWidget(viewer_model.layers, parent=parent_widget)
+        qtbot.addWidget(widget)
+        viewer_model.add_image(np.zeros((4, 4)), name='template')
+        active = viewer_model.add_image(np.zeros((4, 4)), name='active')
+        widget._template_combobox.setCurrentIndex(1)
+        assert widget._apply_button.isEnabled()
+
+        active.data = np.zeros((3, 4, 4))
+        widget._update_inheriting_label()
+
+        assert not widget._apply_button.isEnabled()
+        assert not widget._different_dims_label.isHidden()
+
+    def test_rename_updates_row_without_rebuild(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        viewer_model.add_image(np.zeros((4, 4)), name='a')
+        layer = viewer_model.add_image(np.zeros((4, 4)), name='b')
+        viewer_model.layers.selection.active = layer
+        combobox = inheritance_widget._template_combobox
+        model = combobox.model()
+
+        layer.name = 'renamed'
+
+        assert combobox.model() is model
+        assert combobox.itemText(2) == 'renamed'
+        assert combobox.itemData(2) is layer
+        inheritance_widget._update_layers_combobox()
+        assert combobox.model() is model
+
+    def test_template_selection_survives_rebuild(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        viewer_model.add_image(np.zeros((4, 4)), name='a')
+        template = viewer_model.add_image(np.zeros((4, 4)), name='b')
+        combobox = inheritance_widget._template_combobox
+        combobox.setCurrentIndex(2)
+        assert inheritance_widget._template_layer is template
+
+        viewer_model.add_image(np.zeros((4, 4)), name='c')
+
+        assert combobox.currentIndex() == 2
+        assert combobox.currentData() is template
+        assert inheritance_widget._template_layer is template
+
+    def test_removed_template_falls_back_to_none(
+        self,
+        viewer_model: ViewerModel,
+        inheritance_widget: InheritanceWidget,
+    ) -> None:
+        viewer_model.add_image(np.zeros((4, 4)), name='a')
+        template = viewer_model.add_image(np.zeros((4, 4)), name='b')
+        combobox = inheritance_widget._template_combobox
+        combobox.setCurrentIndex(2)
+
+        viewer_model.layers.remove(template)
+
+        assert combobox.currentIndex() == 0
+        assert combobox.currentData() is None
+        assert inheritance_widget._template_layer is None
+
 
 class TestApplyButton:
     def test_enabled_when_template_and_inheriting_differ_same_ndim(
@@ -13,6 +13,7 @@ Tests cover:
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import numpy as np
 import pytest
@@ -26,6 +27,8 @@ from qtpy.QtWidgets import (
     QWidget,
 )
 
+from napari_metadata.widgets._axis import AxisMetadata, AxisScales
+from napari_metadata.widgets._file import FileGeneralMetadata
 from napari_metadata.widgets._main import (
     _CONTENT_PAGE,
     _NO_LAYER_PAGE,
@@ -104,6 +107,30 @@ class TestMetadataWidgetInit:
     def test_starts_on_no_layer_page(self, metadata_widget: MetadataWidget):
         assert metadata_widget._stacked_layout.currentIndex() == _NO_LAYER_PAGE
 
+    def test_components_are_built_on_first_use(
+        self, metadata_widget: MetadataWidget
+    ):
+        assert not metadata_widget._components_built
+
+        metadata_widget._unbind_components()
+        metadata_widget._refresh_page()
+
+        assert not metadata_widget._components_built
+
+        assert metadata_widget._axis_metadata_instance is not None
+        assert metadata_widget._components_built
+
+    def test_components_are_built_on_first_show(
+        self, viewer_model: ViewerModel, qtbot
+    ):
+        widget = MetadataWidget(viewer_model)
+        qtbot.addWidget(widget)
+
+        widget.show()
+        qtbot.waitExposed(widget)
+
+        assert widget._components_built
+
     def test_has_general_metadata_instance(
         self, metadata_widget: MetadataWidget
     ):
@@ -305,6 +332,27 @@ class TestSizingLogic:
 
         assert calls == ['updated']
 
+    def test_rebuild_suspends_updates_until_page_is_built(
+        self, viewer_with_layer, parent_widget: QWidget, qtbot
+    ):
+        viewer_model, layer = viewer_with_layer
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        widget._selected_layer = layer
+        states: list[bool] = []
+        rebuild = widget._do_rebuild_content
+
+        def _record(orientation) -> None:
+            states.append(widget.updatesEnabled())
+            rebuild(orientation)
+
+        with patch.object(widget, '_do_rebuild_content', side_effect=_record):
+            widget._rebuild_content('vertical')
+
+        assert states == [False]
+        assert widget.updatesEnabled()
+
     def test_event_filter_updates_only_for_scroll_viewport_events(
         self, viewer_with_layer, parent_widget: QWidget, qtbot, monkeypatch
     ):
@@ -421,6 +469,54 @@ class TestSizingLogic:
         assert horizontal_calls == []
         assert vertical_calls == []
 
+    def test_rebuild_sizes_sections_once(
+        self, viewer_with_layer, parent_widget: QWidget, qtbot, monkeypatch
+    ):
+        viewer_model, layer = viewer_with_layer
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        widget._selected_layer = layer
+        widget._file_section_expanded = True
+        widget._axis_section_expanded = True
+        widget._inheritance_section_expanded = True
+        widget._rebuild_content('vertical')
+
+        calls: list[str] = []
+        monkeypatch.setattr(
+            widget,
+            '_update_section_extents',
+            lambda orientation: calls.append(orientation),
+        )
+        widget._rebuild_content('vertical')
+
+        assert calls == ['vertical']
+        assert widget._axis_section is not None
+        assert widget._axis_section.isExpanded()
+
+    def test_rebuild_propagates_geometry_to_parent_layout(
+        self, viewer_with_layer, qtbot
+    ):
+        viewer_model, layer = viewer_with_layer
+        host = QWidget()
+        qtbot.addWidget(host)
+        host_layout = QVBoxLayout(host)
+        widget = MetadataWidget(viewer_model)
+        host_layout.addWidget(widget)
+        widget._selected_layer = layer
+        widget._rebuild_content('vertical')
+        widget._stacked_layout.setCurrentIndex(0)
+        host.show()
+        qtbot.waitExposed(host)
+
+        assert widget._file_section is not None
+        widget._file_section.setExpanded(True)
+        widget._rebuild_content('horizontal')
+
+        qtbot.waitUntil(
+            lambda: host_layout.sizeHint().width() >= widget.sizeHint().width()
+        )
+
     def test_on_inheritance_toggled_updates_checkboxes_and_sizes(
         self, viewer_with_layer, parent_widget: QWidget, qtbot, monkeypatch
     ):
@@ -656,6 +752,34 @@ class TestOrientationSwitching:
             )
         )
 
+    def test_dock_move_while_hidden_rebuilds_once_shown(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+        monkeypatch,
+    ):
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        widget._selected_layer = layer
+        widget._rebuild_content('vertical')
+        widget._already_shown = True
+        monkeypatch.setattr(
+            widget, '_get_required_orientation', lambda: 'horizontal'
+        )
+
+        widget._on_dock_location_changed()
+
+        assert widget._current_orientation == 'vertical'
+
+        parent_widget.show()
+        qtbot.waitExposed(parent_widget)
+
+        assert widget._current_orientation == 'horizontal'
+        assert not widget._orientation_stale
+
 
 class TestLayerSelectionFlow:
     def test_selecting_layer_triggers_content_build(
@@ -696,7 +820,7 @@ class TestLayerSelectionFlow:
 
         assert widget._stacked_layout.currentIndex() == _NO_LAYER_PAGE
 
-    def test_switching_layers_rebuilds_content(
+    def test_switching_layers_rebuilds_only_axis_content(
         self,
         viewer_model: ViewerModel,
         parent_widget: QWidget,
@@ -712,16 +836,56 @@ class TestLayerSelectionFlow:
         viewer_model.layers.selection.active = layer_a
         widget._on_selected_layers_changed()
         first_scroll = widget._scroll_area
+        first_file_section = widget._file_section
+        first_axis_section = widget._axis_section
 
         layer_b = viewer_model.add_image(
             np.zeros((5, 5, 5)), name='b', axis_labels=('z', 'y', 'x')
         )
         viewer_model.layers.selection.active = layer_b
         widget._on_selected_layers_changed()
-        second_scroll = widget._scroll_area
 
-        # New scroll area was created (content rebuilt)
-        assert first_scroll is not second_scroll
+        # Same orientation: the page and sections are kept, and the axis
+        # grid now holds the new layer's widgets.
+        assert widget._scroll_area is first_scroll
+        assert widget._file_section is first_file_section
+        assert widget._axis_section is first_axis_section
+        assert first_axis_section is not None
+        labels = widget._axis_metadata_instance.components[0]
+        assert labels.num_axes == 3
+        for line_edit in labels._line_edits:
+            assert first_axis_section.isAncestorOf(line_edit)
+
+    def test_switching_to_same_ndim_layer_keeps_axis_grid(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+
+        layer_a = viewer_model.add_image(
+            np.zeros((4, 3)), name='a', axis_labels=('y', 'x')
+        )
+        viewer_model.layers.selection.active = layer_a
+        widget._on_selected_layers_changed()
+        axis_section = widget._axis_section
+        assert axis_section is not None
+        axis_content = axis_section._expanding_area.widget()
+        labels = widget._axis_metadata_instance.components[0]
+        line_edits = list(labels._line_edits)
+
+        layer_b = viewer_model.add_image(
+            np.zeros((6, 5)), name='b', axis_labels=('row', 'col')
+        )
+        viewer_model.layers.selection.active = layer_b
+        widget._on_selected_layers_changed()
+
+        assert axis_section._expanding_area.widget() is axis_content
+        assert labels._line_edits == line_edits
+        assert [le.text() for le in line_edits] == ['row', 'col']
 
     def test_expanded_sections_preserved_on_layer_change(
         self,
@@ -895,6 +1059,27 @@ class TestSelectedLayerChangedHandler:
 
         assert widget._scroll_area is first_scroll
 
+    def test_layer_change_reads_axis_values_once(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        """Binding loads the widgets; the grid rebuild must not reload them."""
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        viewer_model.layers.selection.active = layer
+        with patch.object(
+            AxisScales, '_refresh_values', autospec=True
+        ) as refresh:
+            widget._on_selected_layers_changed()
+
+        refresh.assert_not_called()
+        assert widget._axis_metadata_instance._scales.num_axes == 2
+
     def test_switching_layers_disconnects_old_and_connects_new(
         self,
         viewer_model: ViewerModel,
@@ -940,6 +1125,120 @@ class TestSelectedLayerChangedHandler:
         assert widget._selected_layer is None
         assert widget._stacked_layout.currentIndex() == _NO_LAYER_PAGE
 
+    def test_reselecting_deselected_layer_reuses_axis_widgets(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+        spinbox = widget._axis_metadata_instance._scales._spinboxes[0]
+
+        viewer_model.layers.selection.active = None
+        widget._on_selected_layers_changed()
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+
+        assert widget._stacked_layout.currentIndex() == _CONTENT_PAGE
+        assert widget._axis_metadata_instance._scales._spinboxes[0] is spinbox
+
+    def test_removed_layer_is_unbound(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+
+        viewer_model.layers.remove(layer)
+        widget._on_selected_layers_changed()
+
+        assert widget._axis_metadata_instance._selected_layer is None
+        assert widget._axis_metadata_instance._scales.num_axes == 0
+
+    def test_removing_kept_layer_while_deselected_unbinds(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        # Connected in showEvent once docked; wired here directly.
+        viewer_model.layers.events.removed.connect(widget._on_layer_removed)
+
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+        viewer_model.layers.selection.active = None
+        widget._on_selected_layers_changed()
+        assert widget._axis_metadata_instance._selected_layer is layer
+
+        viewer_model.layers.remove(layer)
+
+        assert widget._axis_metadata_instance._selected_layer is None
+
+    def test_reselecting_kept_layer_after_ndim_change_resizes_rows(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+
+        layer = viewer_model.add_image(np.zeros((4, 3, 2)))
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+        viewer_model.layers.selection.active = None
+        widget._on_selected_layers_changed()
+
+        layer.data = np.zeros((4, 3))
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+
+        scales = widget._axis_metadata_instance._scales
+        assert scales.num_axes == layer.ndim == 2
+        scales._spinboxes[0].setValue(2.0)
+        np.testing.assert_array_equal(layer.scale, [2.0, 1.0])
+
+    def test_removing_other_layer_while_deselected_keeps_binding(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        viewer_model.layers.events.removed.connect(widget._on_layer_removed)
+
+        layer = viewer_model.add_image(np.zeros((4, 3)), name='kept')
+        other = viewer_model.add_image(np.zeros((4, 3)), name='other')
+        viewer_model.layers.selection.active = layer
+        widget._on_selected_layers_changed()
+        viewer_model.layers.selection.active = None
+        widget._on_selected_layers_changed()
+
+        viewer_model.layers.remove(other)
+
+        assert widget._axis_metadata_instance._selected_layer is layer
+        assert widget._general_metadata_instance._selected_layer is layer
+
 
 class TestGetSections:
     def test_returns_none_when_sections_not_built(
@@ -1070,6 +1369,31 @@ class TestFileGridPopulation:
 
 
 class TestAxisGridPopulation:
+    @pytest.mark.parametrize('orientation', ['vertical', 'horizontal'])
+    def test_rebuild_iterates_components_without_copying(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+        monkeypatch,
+        orientation: Orientation,
+    ):
+        layer = viewer_model.add_image(np.zeros((4, 3)))
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        widget._selected_layer = layer
+
+        def _copy(self):
+            raise AssertionError('components copied during rebuild')
+
+        monkeypatch.setattr(AxisMetadata, 'components', property(_copy))
+        monkeypatch.setattr(FileGeneralMetadata, 'components', property(_copy))
+
+        widget._rebuild_content(orientation)
+
+        assert widget._axis_section is not None
+
     def test_vertical_axis_grid_populates(
         self,
         viewer_model: ViewerModel,
@@ -1121,38 +1445,40 @@ class TestAxisGridPopulation:
 
 
 class TestSeparatorHelpers:
-    def test_horizontal_separator_adds_three_widgets(self, qtbot):
+    def test_horizontal_separator_adds_one_widget(self, qtbot):
         container = QWidget()
         qtbot.addWidget(container)
         grid = QGridLayout(container)
 
         _add_horizontal_separator(grid, 0, 3)
 
-        # 3 widgets: before padding, line, after padding
-        assert grid.count() == 3
+        # Padding is carried by the line's stylesheet margins.
+        assert grid.count() == 1
 
     def test_horizontal_separator_line_is_hline(self, qtbot):
         container = QWidget()
         qtbot.addWidget(container)
         grid = QGridLayout(container)
+        grid.setVerticalSpacing(8)
 
         _add_horizontal_separator(grid, 0, 3)
 
-        # The second widget (index 1) is the QFrame line
-        line_item = grid.itemAtPosition(1, 0)
+        line_item = grid.itemAtPosition(0, 0)
         assert line_item is not None
         line = line_item.widget()
         assert isinstance(line, QFrame)
         assert line.frameShape() == QFrame.Shape.HLine
+        # 3px line plus 2px padding and one grid spacing on each side.
+        assert line.height() == 3 + 2 * (2 + 8)
 
-    def test_vertical_separator_adds_three_widgets(self, qtbot):
+    def test_vertical_separator_adds_one_widget(self, qtbot):
         container = QWidget()
         qtbot.addWidget(container)
         grid = QGridLayout(container)
 
         _add_vertical_separator(grid, 0, 3)
 
-        assert grid.count() == 3
+        assert grid.count() == 1
 
     def test_vertical_separator_line_is_vline(self, qtbot):
         container = QWidget()
@@ -1161,8 +1487,7 @@ class TestSeparatorHelpers:
 
         _add_vertical_separator(grid, 0, 3)
 
-        # The second widget (column 1) is the QFrame line
-        line_item = grid.itemAtPosition(0, 1)
+        line_item = grid.itemAtPosition(0, 0)
         assert line_item is not None
         line = line_item.widget()
         assert isinstance(line, QFrame)
@@ -1188,6 +1513,37 @@ class TestGetRequiredOrientation:
 
         assert widget._get_required_orientation() == 'vertical'
 
+    def test_selection_changes_reuse_cached_orientation(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+        monkeypatch,
+    ):
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        calls = []
+        monkeypatch.setattr(
+            widget,
+            '_get_required_orientation',
+            lambda: calls.append(None) or 'vertical',
+        )
+
+        layer_a = viewer_model.add_image(np.zeros((4, 3)), name='a')
+        layer_b = viewer_model.add_image(np.zeros((4, 3)), name='b')
+        for layer in (layer_a, layer_b, layer_a):
+            viewer_model.layers.selection.active = layer
+            widget._on_selected_layers_changed()
+
+        assert len(calls) == 1
+
+        widget._invalidate_required_orientation()
+        viewer_model.layers.selection.active = layer_b
+        widget._on_selected_layers_changed()
+
+        assert len(calls) == 2
+
 
 class TestGetDockWidget:
     def test_returns_none_without_dock_parent(
@@ -1246,6 +1602,30 @@ class TestApplyInheritance:
         assert tuple(current.translate) == pytest.approx((10.0, 20.0))
         assert tuple(current.scale) == pytest.approx((5.0, 5.0))
 
+    def test_inheritance_updates_widgets_without_rebuild(
+        self,
+        viewer_model: ViewerModel,
+        parent_widget: QWidget,
+        qtbot,
+    ):
+        current = viewer_model.add_image(np.zeros((4, 3)), scale=(1.0, 1.0))
+        template = viewer_model.add_image(np.zeros((4, 3)), scale=(5.0, 5.0))
+
+        widget = MetadataWidget(viewer_model)
+        widget.setParent(parent_widget)
+        qtbot.addWidget(widget)
+        viewer_model.layers.selection.active = current
+        widget._on_selected_layers_changed()
+        scroll_area = widget._scroll_area
+        scales = widget._axis_metadata_instance._scales
+
+        widget.apply_inheritance_to_current_layer(template)
+
+        assert widget._scroll_area is scroll_area
+        assert [sb.value() for sb in scales._spinboxes] == pytest.approx(
+            [5.0, 5.0]
+        )
+
     def test_inheritance_rejects_dimension_mismatch(
         self,
         viewer_model: ViewerModel,